@@ -1,3 +1,5 @@
+import asyncio
+import atexit
 import logging
 import sys
 from functools import lru_cache
@@ -30,4 +32,17 @@ def get_cached_services() -> Tuple[Any, Any, Any, Any, Any]:
     metadata_fetcher = make_metadata_fetcher(arxiv_client, pdf_parser)  # ← THEN USE IT
     opensearch_client = make_opensearch_client()
     
-    return arxiv_client, pdf_parser, database, metadata_fetcher, opensearch_client
\ No newline at end of file
+    return arxiv_client, pdf_parser, database, metadata_fetcher, opensearch_client
+
+
+@lru_cache(maxsize=1)
+def get_cached_event_loop() -> asyncio.AbstractEventLoop:
+    """Get a process-wide event loop shared by all task invocations.
+
+    Unlike asyncio.run(), which builds and tears down a loop per call, this keeps
+    the loop (and the connection pools of the cached services bound to it) alive
+    for the lifetime of the worker process. The loop is closed at interpreter exit.
+    """
+    loop = asyncio.new_event_loop()
+    atexit.register(loop.close)
+    return loop
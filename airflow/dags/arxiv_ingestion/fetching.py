@@ -1,9 +1,8 @@
-import asyncio
 import logging
 from datetime import datetime, timedelta
 from typing import Optional
 
-from .common import get_cached_services
+from .common import get_cached_event_loop, get_cached_services
 
 logger = logging.getLogger(__name__)
 
@@ -35,45 +34,39 @@ async def run_paper_ingestion_pipeline(
         )
 
 
-def fetch_daily_papers(**context):
+def fetch_daily_papers(target_date: Optional[str] = None, is_manual: str = "False", **context):
     """Fetch daily papers from arXiv and store in PostgreSQL.
 
     This task:
-    1. Determines the target date (defaults to today for manual runs, yesterday for scheduled)
+    1. Receives the target date rendered by the DAG's Jinja template
+       (last week for manual runs, logical date minus one day for scheduled)
     2. Fetches papers from arXiv API
     3. Downloads and processes PDFs using Docling
     4. Stores metadata and parsed content in PostgreSQL
 
     Note: OpenSearch indexing is handled by a separate dedicated task
+
+    :param target_date: Date to fetch papers for (YYYYMMDD format), rendered from op_kwargs
+    :param is_manual: Rendered "True"/"False" flag for manually triggered runs
     """
     logger.info("Starting daily paper fetching task")
 
-    # For manual runs, use today; for scheduled runs, use yesterday
-    execution_date = context.get("execution_date")
-    run_id = context.get("run_id", "")
-
-    if "manual" in run_id:
-        # Manual trigger - fetch papers from last 7 days
-        week_ago = datetime.now() - timedelta(days=7)
-        target_date = week_ago.strftime("%Y%m%d")
-        logger.info(f"Manual run detected - fetching papers from last week: {target_date}")
-    elif execution_date:
-        # Scheduled run - use execution date minus 1 day
-        target_dt = execution_date - timedelta(days=1)
-        target_date = target_dt.strftime("%Y%m%d")
-        logger.info(f"Scheduled run - fetching papers from: {target_date}")
-    else:
-        # Fallback to yesterday
+    if not target_date:
+        # Fallback to yesterday when called outside the templated DAG
         yesterday = datetime.now() - timedelta(days=1)
         target_date = yesterday.strftime("%Y%m%d")
         logger.info(f"Fallback - fetching papers from yesterday: {target_date}")
+    elif is_manual == "True":
+        logger.info(f"Manual run detected - fetching papers from last week: {target_date}")
+    else:
+        logger.info(f"Scheduled run - fetching papers from: {target_date}")
 
     if target_date:
         logger.info(f"Fetching papers for date: {target_date}")
     else:
         logger.info(f"Fetching most recent papers (no date restriction)")
 
-    results = asyncio.run(
+    results = get_cached_event_loop().run_until_complete(
         run_paper_ingestion_pipeline(
             target_date=target_date,
             process_pdfs=True,  # Enabled with smaller batch (25 papers) to avoid OOM
@@ -1,7 +1,8 @@
-import asyncio
 import logging
 from datetime import datetime, timedelta, timezone
 
+from .common import get_cached_event_loop
+
 logger = logging.getLogger(__name__)
 
 
@@ -91,7 +92,7 @@ def index_papers_hybrid(**context):
 
             logger.info(f"Indexing {len(papers)} papers with raw_text for hybrid search")
 
-            stats = asyncio.run(_index_papers_with_chunks(papers))
+            stats = get_cached_event_loop().run_until_complete(_index_papers_with_chunks(papers))
 
             logger.info(
                 f"Hybrid indexing complete: {stats['papers_processed']} papers, "
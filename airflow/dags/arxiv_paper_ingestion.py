@@ -41,9 +41,15 @@ setup_task = PythonOperator(
     dag=dag,
 )
 
+# Target date is resolved by Airflow's templating layer: manual runs look back a week,
+# scheduled runs fetch the day before the logical date
 fetch_task = PythonOperator(
     task_id="fetch_daily_papers",
     python_callable=fetch_daily_papers,
+    op_kwargs={
+        "target_date": "{{ logical_date.subtract(days=7 if dag_run.run_type == 'manual' else 1).strftime('%Y%m%d') }}",
+        "is_manual": "{{ dag_run.run_type == 'manual' }}",
+    },
     dag=dag,
 )
 
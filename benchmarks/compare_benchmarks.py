@@ -7,26 +7,115 @@ This script compares different benchmark results to show:
 - Historical trends
 """
 
-import json
 import logging
+import os
+import sys
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, List, Optional, Tuple
+
+import orjson
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Precompiled %-style formats for the comparison table (cheaper than f-string float formatting)
+LABEL_FMT = "%-30s"
+MISSING_CELL = "%20s" % "N/A"
+PCT_CELL_FMT = "%18.1f%% "
+INT_CELL_FMT = "%s%19s%s "
+FLOAT_CELL_FMT = "%s%19.2f%s "
+PCT_CHANGE_FMT = "%s %7.1f%% (%+.1f%%)"
+INT_CHANGE_FMT = "%s %8s (%+.1f%%)"
+FLOAT_CHANGE_FMT = "%s %8.2f (%+.1f%%)"
+
+# Exported comparisons are NDJSON and can be fed back in as inputs
+NDJSON_SUFFIXES = (".jsonl", ".ndjson")
+
 
 class BenchmarkComparator:
     """Compare multiple benchmark results"""
 
+    # (section title, [(label, key path into a result, format options)]) - built once per process
+    METRIC_SECTIONS = [
+        (
+            "📊 RAGAS SCORES",
+            [
+                ("Overall RAGAS", ("ragas_scores", "ragas_score"), {"default": 0.0}),
+                ("Faithfulness", ("ragas_scores", "faithfulness"), {}),
+                ("Answer Relevancy", ("ragas_scores", "answer_relevancy"), {}),
+                ("Context Precision", ("ragas_scores", "context_precision"), {}),
+                ("Context Recall", ("ragas_scores", "context_recall"), {}),
+            ],
+        ),
+        (
+            "🎯 RANKING METRICS",
+            [
+                ("MRR", ("ranking_metrics", "mrr"), {}),
+                ("Hit Rate@1", ("ranking_metrics", "hit_rate@1"), {"as_percentage": True}),
+                ("Hit Rate@3", ("ranking_metrics", "hit_rate@3"), {"as_percentage": True}),
+                ("Hit Rate@5", ("ranking_metrics", "hit_rate@5"), {"as_percentage": True}),
+                ("Hit Rate@10", ("ranking_metrics", "hit_rate@10"), {"as_percentage": True}),
+            ],
+        ),
+        (
+            "⚡ LATENCY METRICS (ms)",
+            [
+                ("Average Latency", ("latency_metrics", "avg_ms"), {"suffix": " ms"}),
+                ("P50 Latency", ("latency_metrics", "p50_ms"), {"suffix": " ms"}),
+                ("P95 Latency", ("latency_metrics", "p95_ms"), {"suffix": " ms"}),
+                ("P99 Latency", ("latency_metrics", "p99_ms"), {"suffix": " ms"}),
+            ],
+        ),
+        (
+            "💰 COST METRICS",
+            [
+                ("Total Tokens", ("cost_metrics", "total_tokens"), {"as_int": True}),
+                ("Avg Tokens/Query", ("cost_metrics", "avg_tokens_per_query"), {}),
+                ("Total Cost (USD)", ("cost_metrics", "estimated_cost_usd"), {"prefix": "$"}),
+            ],
+        ),
+    ]
+
+    # 1 = higher is better, -1 = lower is better
+    DIRECTION = {
+        "Overall RAGAS": 1,
+        "Faithfulness": 1,
+        "Answer Relevancy": 1,
+        "Context Precision": 1,
+        "Context Recall": 1,
+        "MRR": 1,
+        "Hit Rate@1": 1,
+        "Hit Rate@3": 1,
+        "Hit Rate@5": 1,
+        "Hit Rate@10": 1,
+        "Average Latency": -1,
+        "P50 Latency": -1,
+        "P95 Latency": -1,
+        "P99 Latency": -1,
+        "Total Tokens": -1,
+        "Avg Tokens/Query": -1,
+        "Total Cost (USD)": -1,
+    }
+
     def __init__(self, result_files: List[str]):
-        """Load multiple benchmark result files"""
+        """Load benchmark result files and/or previously exported NDJSON comparisons"""
         self.results = []
         for file_path in result_files:
-            with open(file_path, "r") as f:
-                data = json.load(f)
-                data["_source_file"] = Path(file_path).name
-                self.results.append(data)
+            with open(file_path, "rb") as f:
+                raw = f.read()
+            if not file_path.endswith(NDJSON_SUFFIXES):
+                try:
+                    data = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    # Not a single document: an exported comparison saved under another suffix (e.g. cmp.json)
+                    pass
+                else:
+                    data["_source_file"] = os.path.basename(file_path)
+                    self.results.append(data)
+                    continue
+            # Exported comparison: line 1 is the summary, each following line is one run
+            lines = raw.splitlines()[1:]
+            self.results.extend(orjson.loads(line) for line in lines if line.strip())
 
         logger.info(f"Loaded {len(self.results)} benchmark results")
 
@@ -36,85 +125,65 @@ class BenchmarkComparator:
             logger.warning("Need at least 2 results to compare")
             return
 
-        print("\n" + "=" * 120)
-        print("BENCHMARK COMPARISON REPORT".center(120))
-        print("=" * 120)
+        # Collect the whole report and write it once instead of one print per cell
+        buf: List[str] = []
+        out = buf.append
+
+        out("\n" + "=" * 120 + "\n")
+        out("BENCHMARK COMPARISON REPORT".center(120) + "\n")
+        out("=" * 120 + "\n")
 
         # Print header
-        print(f"\n{'Metric':<30}", end="")
-        for i, result in enumerate(self.results):
-            print(f"{'Run ' + str(i+1):>20}", end="")
-        print(f"{'Change':>20}")
-        print("-" * 120)
-
-        # RAGAS Scores
-        print("\n📊 RAGAS SCORES")
-        print("-" * 120)
-        self._compare_metric("Overall RAGAS", lambda r: r["ragas_scores"].get("ragas_score", 0.0))
-        self._compare_metric("Faithfulness", lambda r: r["ragas_scores"]["faithfulness"])
-        self._compare_metric("Answer Relevancy", lambda r: r["ragas_scores"]["answer_relevancy"])
-        self._compare_metric("Context Precision", lambda r: r["ragas_scores"]["context_precision"])
-        self._compare_metric("Context Recall", lambda r: r["ragas_scores"]["context_recall"])
-
-        # Ranking Metrics
-        print("\n🎯 RANKING METRICS")
-        print("-" * 120)
-        self._compare_metric("MRR", lambda r: r["ranking_metrics"]["mrr"])
-        self._compare_metric("Hit Rate@1", lambda r: r["ranking_metrics"]["hit_rate@1"], as_percentage=True)
-        self._compare_metric("Hit Rate@3", lambda r: r["ranking_metrics"]["hit_rate@3"], as_percentage=True)
-        self._compare_metric("Hit Rate@5", lambda r: r["ranking_metrics"]["hit_rate@5"], as_percentage=True)
-        self._compare_metric("Hit Rate@10", lambda r: r["ranking_metrics"]["hit_rate@10"], as_percentage=True)
-
-        # Latency Metrics
-        print("\n⚡ LATENCY METRICS (ms)")
-        print("-" * 120)
-        self._compare_metric("Average Latency", lambda r: r["latency_metrics"]["avg_ms"], suffix=" ms")
-        self._compare_metric("P50 Latency", lambda r: r["latency_metrics"]["p50_ms"], suffix=" ms")
-        self._compare_metric("P95 Latency", lambda r: r["latency_metrics"]["p95_ms"], suffix=" ms")
-        self._compare_metric("P99 Latency", lambda r: r["latency_metrics"]["p99_ms"], suffix=" ms")
-
-        # Cost Metrics
-        print("\n💰 COST METRICS")
-        print("-" * 120)
-        self._compare_metric("Total Tokens", lambda r: r["cost_metrics"]["total_tokens"], as_int=True)
-        self._compare_metric("Avg Tokens/Query", lambda r: r["cost_metrics"]["avg_tokens_per_query"])
-        self._compare_metric("Total Cost (USD)", lambda r: r["cost_metrics"]["estimated_cost_usd"], prefix="$")
+        out(f"\n{'Metric':<30}")
+        for i in range(len(self.results)):
+            out(f"{'Run ' + str(i+1):>20}")
+        out(f"{'Change':>20}\n")
+        out("-" * 120 + "\n")
+
+        for section, metrics in self.METRIC_SECTIONS:
+            out(f"\n{section}\n")
+            out("-" * 120 + "\n")
+            for label, path, fmt in metrics:
+                out(self._compare_metric(label, path, **fmt) + "\n")
 
         # Summary Statistics
-        print("\n📈 IMPROVEMENT SUMMARY")
-        print("-" * 120)
-        self._print_improvement_summary()
+        out("\n📈 IMPROVEMENT SUMMARY\n")
+        out("-" * 120 + "\n")
+        buf.extend(line + "\n" for line in self._improvement_summary_lines())
 
-        print("\n" + "=" * 120 + "\n")
+        out("\n" + "=" * 120 + "\n\n")
+
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
 
     def _compare_metric(
         self,
         label: str,
-        extractor: callable,
+        path: Tuple[str, ...],
+        default: Optional[float] = None,
         as_percentage: bool = False,
         as_int: bool = False,
         prefix: str = "",
         suffix: str = "",
-    ):
-        """Compare a single metric across all results"""
-        print(f"{label:<30}", end="")
+    ) -> str:
+        """Format one comparison row for a single metric across all results"""
+        row = [LABEL_FMT % label]
 
         values = []
         for result in self.results:
-            try:
-                value = extractor(result)
-                values.append(value)
-
-                # Format value
-                if as_percentage:
-                    print(f"{value:>19.1%}", end=" ")
-                elif as_int:
-                    print(f"{prefix}{int(value):>19,}{suffix}", end=" ")
-                else:
-                    print(f"{prefix}{value:>19.2f}{suffix}", end=" ")
-            except (KeyError, TypeError) as e:
-                print(f"{'N/A':>20}", end="")
-                values.append(None)
+            value = self._dig(result, path, default)
+            values.append(value)
+
+            # Format value
+            if value is None:
+                row.append(MISSING_CELL)
+            elif as_percentage:
+                row.append(PCT_CELL_FMT % (value * 100))
+            elif as_int:
+                # Thousands separator still needs format()
+                row.append(INT_CELL_FMT % (prefix, format(int(value), ","), suffix))
+            else:
+                row.append(FLOAT_CELL_FMT % (prefix, value, suffix))
 
         # Calculate change (first to last)
         if len(values) >= 2 and values[0] is not None and values[-1] is not None:
@@ -128,44 +197,33 @@ class BenchmarkComparator:
             symbol = "🟢" if is_improvement else "🔴" if change != 0 else "⚪"
 
             if as_percentage:
-                print(f"{symbol} {change:>8.1%} ({pct_change:+.1f}%)")
+                row.append(PCT_CHANGE_FMT % (symbol, change * 100, pct_change))
             elif as_int:
-                print(f"{symbol} {int(change):>8,} ({pct_change:+.1f}%)")
+                row.append(INT_CHANGE_FMT % (symbol, format(int(change), ","), pct_change))
             else:
-                print(f"{symbol} {change:>8.2f} ({pct_change:+.1f}%)")
-        else:
-            print()
+                row.append(FLOAT_CHANGE_FMT % (symbol, change, pct_change))
 
-    def _is_improvement(self, label: str, change: float) -> bool:
-        """Determine if a change is an improvement"""
-        # Metrics where higher is better
-        higher_is_better = [
-            "RAGAS",
-            "Faithfulness",
-            "Relevancy",
-            "Precision",
-            "Recall",
-            "MRR",
-            "Hit Rate",
-        ]
-
-        # Metrics where lower is better
-        lower_is_better = ["Latency", "Cost", "Tokens"]
+        return "".join(row)
 
-        for keyword in higher_is_better:
-            if keyword in label:
-                return change > 0
+    @staticmethod
+    def _dig(data: Dict, path: Tuple[str, ...], default: Optional[float] = None) -> Optional[float]:
+        """Walk nested result dicts along path; None when an intermediate level is missing"""
+        *parents, key = path
+        for parent in parents:
+            if not isinstance(data, dict):
+                return None
+            data = data.get(parent)
+        return data.get(key, default) if isinstance(data, dict) else None
 
-        for keyword in lower_is_better:
-            if keyword in label:
-                return change < 0
-
-        return change > 0  # Default: assume higher is better
+    def _is_improvement(self, label: str, change: float) -> bool:
+        """Determine if a change is an improvement"""
+        direction = self.DIRECTION.get(label, 1)  # Default: assume higher is better
+        return (change > 0) if direction == 1 else (change < 0)
 
-    def _print_improvement_summary(self):
-        """Print summary of improvements"""
+    def _improvement_summary_lines(self) -> List[str]:
+        """Format summary of improvements as report lines"""
         if len(self.results) < 2:
-            return
+            return []
 
         first = self.results[0]
         last = self.results[-1]
@@ -175,53 +233,58 @@ class BenchmarkComparator:
 
         # Check key metrics
         metrics_to_check = [
-            ("RAGAS Score", lambda r: r["ragas_scores"].get("ragas_score", 0), True),
-            ("MRR", lambda r: r["ranking_metrics"]["mrr"], True),
-            ("Hit Rate@5", lambda r: r["ranking_metrics"]["hit_rate@5"], True),
-            ("Avg Latency (ms)", lambda r: r["latency_metrics"]["avg_ms"], False),
-            ("Total Cost ($)", lambda r: r["cost_metrics"]["estimated_cost_usd"], False),
+            ("RAGAS Score", ("ragas_scores", "ragas_score"), 0, True),
+            ("MRR", ("ranking_metrics", "mrr"), None, True),
+            ("Hit Rate@5", ("ranking_metrics", "hit_rate@5"), None, True),
+            ("Avg Latency (ms)", ("latency_metrics", "avg_ms"), None, False),
+            ("Total Cost ($)", ("cost_metrics", "estimated_cost_usd"), None, False),
         ]
 
-        for label, extractor, higher_is_better in metrics_to_check:
-            try:
-                first_val = extractor(first)
-                last_val = extractor(last)
-                change = last_val - first_val
-                pct_change = (change / first_val * 100) if first_val != 0 else 0
+        for label, path, default, higher_is_better in metrics_to_check:
+            first_val = self._dig(first, path, default)
+            last_val = self._dig(last, path, default)
+            if first_val is None or last_val is None:
+                continue
 
-                is_improvement = (change > 0) if higher_is_better else (change < 0)
+            change = last_val - first_val
+            pct_change = (change / first_val * 100) if first_val != 0 else 0
 
-                if abs(pct_change) > 1:  # Only show significant changes
-                    msg = f"{label}: {pct_change:+.1f}% ({first_val:.3f} → {last_val:.3f})"
-                    if is_improvement:
-                        improvements.append(msg)
-                    else:
-                        degradations.append(msg)
-            except (KeyError, TypeError):
-                pass
+            is_improvement = (change > 0) if higher_is_better else (change < 0)
 
+            if abs(pct_change) > 1:  # Only show significant changes
+                msg = f"{label}: {pct_change:+.1f}% ({first_val:.3f} → {last_val:.3f})"
+                if is_improvement:
+                    improvements.append(msg)
+                else:
+                    degradations.append(msg)
+
+        lines = []
         if improvements:
-            print("\n✅ Improvements:")
-            for imp in improvements:
-                print(f"   • {imp}")
+            lines.append("\n✅ Improvements:")
+            lines.extend(f"   • {imp}" for imp in improvements)
 
         if degradations:
-            print("\n⚠️  Degradations:")
-            for deg in degradations:
-                print(f"   • {deg}")
+            lines.append("\n⚠️  Degradations:")
+            lines.extend(f"   • {deg}" for deg in degradations)
 
         if not improvements and not degradations:
-            print("\n⚪ No significant changes detected")
+            lines.append("\n⚪ No significant changes detected")
+
+        return lines
 
     def export_comparison(self, output_path: str):
-        """Export comparison to JSON"""
-        comparison_data = {
-            "results": self.results,
+        """Export comparison as newline-delimited JSON: a summary line, then one line per run"""
+        summary = {
+            "source_files": [result["_source_file"] for result in self.results],
             "summary": self._generate_summary(),
         }
 
-        with open(output_path, "w") as f:
-            json.dump(comparison_data, f, indent=2)
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(summary))
+            f.write(b"\n")
+            for result in self.results:
+                f.write(orjson.dumps(result))
+                f.write(b"\n")
 
         logger.info(f"Comparison exported to {output_path}")
 
@@ -249,8 +312,10 @@ def main():
     import argparse
 
     parser = argparse.ArgumentParser(description="Compare multiple benchmark results")
-    parser.add_argument("result_files", nargs="+", help="Paths to benchmark result JSON files")
-    parser.add_argument("--export", help="Export comparison to JSON file")
+    parser.add_argument(
+        "result_files", nargs="+", help="Paths to benchmark result JSON files or exported comparisons"
+    )
+    parser.add_argument("--export", help="Export comparison to a newline-delimited JSON (.jsonl) file")
 
     args = parser.parse_args()
 
@@ -8,18 +8,20 @@ This script helps you create evaluation datasets by:
 """
 
 import asyncio
-import json
 import logging
 import os
 import sys
+from contextlib import AsyncExitStack
 from pathlib import Path
 from typing import List, Dict, Any
 
-import httpx
+import orjson
 from dotenv import load_dotenv
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from benchmarks.http_client import make_async_client
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -29,10 +31,22 @@ load_dotenv()
 class DatasetGenerator:
     """Generate evaluation datasets for RAG benchmarking"""
 
-    def __init__(self, api_base_url: str, llm_api_key: str = None):
+    def __init__(
+        self,
+        api_base_url: str,
+        llm_api_key: str = None,
+        max_concurrent_llm_calls: int = 8,
+        qa_batch_size: int = 10,
+    ):
         self.api_base_url = api_base_url
-        self.client = httpx.AsyncClient(timeout=60.0)
+        self.client = make_async_client(timeout=60.0)
+        # Owns every client created by the generator so close() releases them together
+        self._exit_stack = AsyncExitStack()
+        self._exit_stack.push_async_callback(self.client.aclose)
         self.llm_api_key = llm_api_key or os.getenv("OPENAI_API_KEY")
+        self.max_concurrent_llm_calls = max_concurrent_llm_calls
+        self.qa_batch_size = qa_batch_size
+        self._llm_client = None
 
     async def generate_synthetic_qa_pairs(
         self, num_pairs: int = 10, categories: List[str] = None
@@ -47,29 +61,34 @@ class DatasetGenerator:
         """
         logger.info(f"Generating {num_pairs} synthetic QA pairs...")
 
-        dataset = {
-            "questions": [],
-            "ground_truths": [],
-            "relevant_doc_ids": [],
-            "ground_truth_contexts": [],
-        }
-
         # Fetch papers from your index
         papers = await self._fetch_sample_papers(num_pairs, categories)
 
-        for i, paper in enumerate(papers):
-            logger.info(f"Processing paper {i+1}/{len(papers)}: {paper['title'][:50]}...")
-
-            # Generate question and answer from paper content
-            qa_pair = await self._generate_qa_from_paper(paper)
-
-            if qa_pair:
-                dataset["questions"].append(qa_pair["question"])
-                dataset["ground_truths"].append(qa_pair["answer"])
-                dataset["relevant_doc_ids"].append([paper["arxiv_id"]])
-                dataset["ground_truth_contexts"].append([paper["abstract"]])
-
-        return dataset
+        # Papers are sent to the LLM in batches; batches run concurrently, bounded by the semaphore
+        batches = [papers[i : i + self.qa_batch_size] for i in range(0, len(papers), self.qa_batch_size)]
+        llm_semaphore = asyncio.Semaphore(self.max_concurrent_llm_calls)
+
+        async def generate(i: int, batch: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+            async with llm_semaphore:
+                logger.info(f"Processing batch {i+1}/{len(batches)} ({len(batch)} papers)...")
+                return await self._generate_qa_batch(batch)
+
+        batch_results = await asyncio.gather(*(generate(i, batch) for i, batch in enumerate(batches)), return_exceptions=True)
+
+        valid_pairs = []
+        for batch, qa_pairs in zip(batches, batch_results):
+            if isinstance(qa_pairs, Exception):
+                logger.error(f"Failed to generate QA pairs for batch starting at {batch[0]['arxiv_id']}: {qa_pairs}")
+                continue
+            valid_pairs.extend((paper, qa_pair) for paper, qa_pair in zip(batch, qa_pairs) if qa_pair)
+
+        # Each column is built once at its final size instead of growing by append
+        return {
+            "questions": [qa_pair["question"] for _, qa_pair in valid_pairs],
+            "ground_truths": [qa_pair["answer"] for _, qa_pair in valid_pairs],
+            "relevant_doc_ids": [[paper["arxiv_id"]] for paper, _ in valid_pairs],
+            "ground_truth_contexts": [[paper["abstract"]] for paper, _ in valid_pairs],
+        }
 
     async def _fetch_sample_papers(
         self, num_papers: int, categories: List[str] = None
@@ -89,10 +108,10 @@ class DatasetGenerator:
             "natural language processing",
         ]
 
-        papers = []
-        for query in queries[: min(len(queries), num_papers)]:
-            try:
-                response = await self.client.post(
+        selected_queries = queries[: min(len(queries), num_papers)]
+        responses = await asyncio.gather(
+            *(
+                self.client.post(
                     f"{self.api_base_url}/hybrid-search/",
                     json={
                         "query": query,
@@ -101,6 +120,16 @@ class DatasetGenerator:
                         "categories": categories,
                     },
                 )
+                for query in selected_queries
+            ),
+            return_exceptions=True,
+        )
+
+        papers = []
+        for query, response in zip(selected_queries, responses):
+            try:
+                if isinstance(response, Exception):
+                    raise response
                 response.raise_for_status()
                 data = response.json()
 
@@ -119,6 +148,68 @@ class DatasetGenerator:
 
         return papers[:num_papers]
 
+    def _get_llm_client(self):
+        """Create the LLM client on first use and share it across all papers"""
+        if self._llm_client is None:
+            # Using OpenAI as example - adjust for your preferred LLM
+            from openai import AsyncOpenAI
+
+            self._llm_client = AsyncOpenAI(api_key=self.llm_api_key, http_client=make_async_client(timeout=60.0))
+            self._exit_stack.push_async_callback(self._llm_client.close)
+        return self._llm_client
+
+    async def _generate_qa_batch(self, papers: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """
+        Generate one question-answer pair per paper with a single JSON-mode LLM request.
+
+        Falls back to one request per paper if the batched response does not validate.
+        """
+        if len(papers) == 1:
+            return [await self._generate_qa_from_paper(papers[0])]
+
+        try:
+            paper_blocks = "\n\n".join(
+                f"Paper {i}:\nTitle: {paper['title']}\nAbstract: {paper['abstract']}" for i, paper in enumerate(papers, 1)
+            )
+            prompt = f"""For EACH of the {len(papers)} research papers below, generate ONE specific question that a researcher might ask, along with a detailed answer.
+
+{paper_blocks}
+
+Each question must:
+1. Be specific and answerable from that paper's abstract
+2. Be useful for evaluating a RAG system
+3. Require understanding of the paper's content
+
+Return ONLY valid JSON with exactly one entry per paper, in paper order:
+{{
+    "pairs": [
+        {{"question": "Your question here", "answer": "Detailed answer here"}}
+    ]
+}}"""
+
+            response = await self._get_llm_client().chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": "You are a helpful research assistant."},
+                    {"role": "user", "content": prompt},
+                ],
+                response_format={"type": "json_object"},
+                temperature=0.7,
+            )
+
+            pairs = orjson.loads(response.choices[0].message.content)["pairs"]
+            if len(pairs) == len(papers) and all(pair.get("question") and pair.get("answer") for pair in pairs):
+                return pairs
+
+            logger.warning(f"Batched QA response did not validate ({len(pairs)} pairs for {len(papers)} papers)")
+
+        except Exception as e:
+            logger.warning(f"Batched QA generation failed: {e}")
+
+        logger.info(f"Falling back to per-paper QA generation for {len(papers)} papers")
+        # One request at a time: the caller holds a single LLM concurrency slot for this whole batch
+        return [await self._generate_qa_from_paper(paper) for paper in papers]
+
     async def _generate_qa_from_paper(self, paper: Dict[str, Any]) -> Dict[str, str]:
         """
         Generate a question-answer pair from a paper using LLM.
@@ -126,11 +217,6 @@ class DatasetGenerator:
         Uses OpenAI/Anthropic/Gemini to create realistic questions.
         """
         try:
-            # Using OpenAI as example - adjust for your preferred LLM
-            from openai import AsyncOpenAI
-
-            client = AsyncOpenAI(api_key=self.llm_api_key)
-
             prompt = f"""Based on this research paper, generate ONE specific question that a researcher might ask, along with a detailed answer.
 
 Title: {paper['title']}
@@ -147,7 +233,7 @@ Return ONLY valid JSON in this format:
     "answer": "Detailed answer here"
 }}"""
 
-            response = await client.chat.completions.create(
+            response = await self._get_llm_client().chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": "You are a helpful research assistant."},
@@ -158,7 +244,7 @@ Return ONLY valid JSON in this format:
 
             result = response.choices[0].message.content
             # Parse JSON from response
-            qa_pair = json.loads(result)
+            qa_pair = orjson.loads(result)
             return qa_pair
 
         except Exception as e:
@@ -179,16 +265,15 @@ Return ONLY valid JSON in this format:
             "ground_truth_contexts": [[] for _ in range(num_questions)],
         }
 
-        with open(output_path, "w") as f:
-            json.dump(template, f, indent=2)
+        Path(output_path).write_bytes(orjson.dumps(template, option=orjson.OPT_INDENT_2))
 
         logger.info(f"Template created at {output_path}")
         print(f"\n✅ Template created at {output_path}")
         print("Fill in your questions, answers, and relevant document IDs.")
 
     async def close(self):
-        """Close HTTP client"""
-        await self.client.aclose()
+        """Close HTTP and LLM clients"""
+        await self._exit_stack.aclose()
 
 
 async def main():
@@ -221,8 +306,7 @@ async def main():
         dataset = await generator.generate_synthetic_qa_pairs(num_pairs=args.num_pairs)
 
         output_path = Path(__file__).parent / args.output
-        with open(output_path, "w") as f:
-            json.dump(dataset, f, indent=2)
+        output_path.write_bytes(orjson.dumps(dataset, option=orjson.OPT_INDENT_2))
 
         logger.info(f"Dataset saved to {output_path}")
         print(f"\n✅ Generated {len(dataset['questions'])} QA pairs")
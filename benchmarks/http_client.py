@@ -0,0 +1,30 @@
+"""
+Shared HTTP client settings for the benchmark scripts.
+
+Every benchmark call targets the same API host, so a large keep-alive pool and
+HTTP/2 (when available) let requests share connections instead of re-handshaking.
+"""
+
+import importlib.util
+
+import httpx
+
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]"); without it httpx stays on HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def make_async_client(
+    timeout: float, max_connections: int = 32, connect_timeout: float = 5.0, keepalive_expiry: float = 60.0
+) -> httpx.AsyncClient:
+    """Create an AsyncClient with HTTP/2 (if installed) and a keep-alive pool sized for concurrent runs"""
+    return httpx.AsyncClient(
+        # Fail fast on an unreachable host; reads keep the long timeout for slow RAG responses
+        timeout=httpx.Timeout(timeout, connect=connect_timeout),
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            # Idle connections survive the gaps between benchmark phases
+            keepalive_expiry=keepalive_expiry,
+        ),
+    )
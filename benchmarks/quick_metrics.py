@@ -6,6 +6,7 @@ Just tells you what you have so you can write honest resume bullets.
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Try to get database count
@@ -13,6 +14,7 @@ def get_paper_count():
     """Get actual paper count from database"""
     try:
         from sqlalchemy import create_engine, text
+        from sqlalchemy.pool import NullPool
         from dotenv import load_dotenv
 
         load_dotenv()
@@ -21,32 +23,50 @@ def get_paper_count():
         if not db_url:
             return None, "DATABASE_URL not set"
 
-        engine = create_engine(db_url)
+        # One-shot script: no pool to set up, one connection for one query
+        engine = create_engine(db_url, poolclass=NullPool)
         with engine.connect() as conn:
-            result = conn.execute(text('SELECT COUNT(*) FROM papers'))
-            count = result.scalar()
-
-            # Get date range
-            result = conn.execute(text(
-                'SELECT MIN(published_date), MAX(published_date) FROM papers'
-            ))
-            dates = result.fetchone()
+            # Count and date range in a single round trip
+            count, earliest, latest = conn.execute(text(
+                'SELECT COUNT(*), MIN(published_date), MAX(published_date) FROM papers'
+            )).fetchone()
 
             return {
                 'count': count,
-                'date_range': f"{dates[0]} to {dates[1]}" if dates else None
+                'date_range': f"{earliest} to {latest}"
             }, None
 
     except Exception as e:
         return None, str(e)
 
+def get_opensearch_indices():
+    """Get arxiv index names and document counts from OpenSearch"""
+    try:
+        import requests
+
+        # Let OpenSearch filter to the arxiv indices and return only the two columns we print
+        response = requests.get(
+            'http://localhost:9200/_cat/indices/arxiv*?format=json&h=index,docs.count', timeout=(2, 5)
+        )
+        if not response.ok:
+            return None, "OpenSearch not responding"
+        return response.json(), None
+
+    except Exception as e:
+        return None, f"Could not connect: {e}"
+
 def main():
     print("🔍 Getting YOUR Real Metrics")
     print("=" * 60)
 
+    # Both checks are independent I/O, so run them side by side and print in order
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        papers_future = executor.submit(get_paper_count)
+        indices_future = executor.submit(get_opensearch_indices)
+
     # 1. Check papers in database
     print("\n📚 Checking PostgreSQL database...")
-    papers_info, error = get_paper_count()
+    papers_info, error = papers_future.result()
 
     if papers_info:
         paper_count = papers_info['count']
@@ -60,19 +80,13 @@ def main():
 
     # 2. Check if OpenSearch is running (simple check)
     print("\n📊 Checking OpenSearch...")
-    try:
-        import requests
-        response = requests.get('http://localhost:9200/_cat/indices?format=json', timeout=5)
-        if response.ok:
-            indices = response.json()
-            for idx in indices:
-                if 'arxiv' in idx.get('index', ''):
-                    print(f"   ✓ Index: {idx['index']}")
-                    print(f"   ✓ Documents: {idx.get('docs.count', 'Unknown')}")
-        else:
-            print("   ✗ OpenSearch not responding")
-    except Exception as e:
-        print(f"   ✗ Could not connect: {e}")
+    indices, error = indices_future.result()
+    if indices is not None:
+        for idx in indices:
+            print(f"   ✓ Index: {idx['index']}")
+            print(f"   ✓ Documents: {idx.get('docs.count', 'Unknown')}")
+    else:
+        print(f"   ✗ {error}")
         print("   → Make sure OpenSearch is running on port 9200")
 
     # 3. Print honest resume bullets
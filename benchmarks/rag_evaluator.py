@@ -13,8 +13,10 @@ import asyncio
 import logging
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Union
 
+import numpy as np
+import orjson
 from datasets import Dataset
 from ragas import evaluate
 from ragas.metrics import (
@@ -23,14 +25,21 @@ from ragas.metrics import (
     context_recall,
     faithfulness,
 )
+from ragas.run_config import RunConfig
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 import os
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Metric columns in the RAGAS per-sample results
+RAGAS_METRIC_NAMES = ["faithfulness", "answer_relevancy", "context_precision", "context_recall"]
 
-@dataclass
+# Emit one progress line per this many completed questions
+PROGRESS_LOG_EVERY = 50
+
+
+@dataclass(slots=True)
 class RAGResponse:
     """Response from RAG system"""
 
@@ -40,9 +49,11 @@ class RAGResponse:
     latency_ms: float
     tokens_used: int
     model_used: str
+    # Reused result of an identical earlier query; its latency belongs to that query
+    cached: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationResult:
     """Complete evaluation results"""
 
@@ -86,6 +97,7 @@ class RAGEvaluator:
         self,
         rag_pipeline: callable,
         cost_per_1k_tokens: float = 0.0015,  # Default: ~GPT-3.5-turbo pricing
+        max_concurrency: int = 8,
     ):
         """
         Initialize evaluator.
@@ -93,16 +105,20 @@ class RAGEvaluator:
         Args:
             rag_pipeline: Async function that takes a query and returns RAGResponse
             cost_per_1k_tokens: Cost per 1000 tokens for cost estimation
+            max_concurrency: Maximum number of questions sent to the RAG pipeline at once
         """
         self.rag_pipeline = rag_pipeline
         self.cost_per_1k_tokens = cost_per_1k_tokens
+        self.max_concurrency = max_concurrency
+        self._ragas_llm = None
+        self._ragas_embeddings = None
 
     async def evaluate(
         self,
         questions: List[str],
         ground_truths: List[str],
         ground_truth_contexts: Optional[List[List[str]]] = None,
-        relevant_doc_ids: Optional[List[List[str]]] = None,
+        relevant_doc_ids: Optional[List[Set[str]]] = None,
     ) -> EvaluationResult:
         """
         Run comprehensive evaluation.
@@ -118,44 +134,66 @@ class RAGEvaluator:
         """
         logger.info(f"Starting evaluation with {len(questions)} questions")
 
-        # Run RAG pipeline on all questions
-        responses: List[RAGResponse] = []
+        # Run RAG pipeline on all questions concurrently, bounded by the semaphore
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        completed = 0
+
+        async def run_question(i: int, question: str) -> RAGResponse:
+            nonlocal completed
+            async with semaphore:
+                logger.debug(f"Processing question {i+1}/{len(questions)}: {question[:50]}...")
+                try:
+                    return await self.rag_pipeline(question)
+                finally:
+                    # Aggregate progress instead of one INFO line per question
+                    completed += 1
+                    if completed % PROGRESS_LOG_EVERY == 0 or completed == len(questions):
+                        logger.info(f"Processed {completed}/{len(questions)} questions")
+
+        results = await asyncio.gather(
+            *(run_question(i, question) for i, question in enumerate(questions)), return_exceptions=True
+        )
+
+        # Single pass over the results collects everything the metric calculations need;
+        # failed questions contribute an empty answer and no retrieved documents
+        answers: List[str] = []
+        contexts: List[List[str]] = []
+        retrieved_documents: List[List[Dict[str, Any]]] = []
         latencies: List[float] = []
+        total_tokens = 0
         failed_count = 0
 
-        for i, question in enumerate(questions):
-            try:
-                logger.info(f"Processing question {i+1}/{len(questions)}: {question[:50]}...")
-                response = await self.rag_pipeline(question)
-                responses.append(response)
-                latencies.append(response.latency_ms)
-            except Exception as e:
-                logger.error(f"Failed to process question {i+1}: {e}")
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to process question {i+1}: {result}")
                 failed_count += 1
-                # Add placeholder response
-                responses.append(
-                    RAGResponse(
-                        answer="",
-                        contexts=[],
-                        source_documents=[],
-                        latency_ms=0,
-                        tokens_used=0,
-                        model_used="",
-                    )
-                )
+                answers.append("")
+                contexts.append([])
+                retrieved_documents.append([])
+                continue
+
+            answers.append(result.answer)
+            contexts.append(result.contexts)
+            retrieved_documents.append(result.source_documents)
+            if result.latency_ms > 0 and not result.cached:
+                latencies.append(result.latency_ms)
+            total_tokens += result.tokens_used
 
         # Calculate RAGAS scores
-        ragas_scores = await self._calculate_ragas_scores(questions, responses, ground_truths, ground_truth_contexts)
+        ragas_scores = await self._calculate_ragas_scores(
+            questions, answers, contexts, ground_truths, ground_truth_contexts
+        )
 
         # Calculate ranking metrics (MRR, Hit Rate@k)
-        ranking_metrics = self._calculate_ranking_metrics(responses, relevant_doc_ids) if relevant_doc_ids else {}
+        ranking_metrics = (
+            self._calculate_ranking_metrics(retrieved_documents, relevant_doc_ids) if relevant_doc_ids else {}
+        )
 
         # Calculate latency metrics
-        latencies = [r.latency_ms for r in responses if r.latency_ms > 0]
         latency_metrics = self._calculate_latency_metrics(latencies)
 
         # Calculate cost metrics
-        cost_metrics = self._calculate_cost_metrics(responses)
+        cost_metrics = self._calculate_cost_metrics(total_tokens, len(results))
 
         result = EvaluationResult(
             ragas_scores=ragas_scores,
@@ -181,7 +219,8 @@ class RAGEvaluator:
     async def _calculate_ragas_scores(
         self,
         questions: List[str],
-        responses: List[RAGResponse],
+        answers: List[str],
+        contexts: List[List[str]],
         ground_truths: List[str],
         ground_truth_contexts: Optional[List[List[str]]],
     ) -> Dict[str, float]:
@@ -191,8 +230,8 @@ class RAGEvaluator:
         # Prepare data for RAGAS
         data = {
             "question": questions,
-            "answer": [r.answer for r in responses],
-            "contexts": [r.contexts for r in responses],
+            "answer": answers,
+            "contexts": contexts,
             "ground_truth": ground_truths,
         }
 
@@ -202,6 +241,56 @@ class RAGEvaluator:
 
         dataset = Dataset.from_dict(data)
 
+        llm, embeddings = self._get_ragas_judge()
+
+        # Judge calls are independent per sample and metric, so let RAGAS fan them out
+        run_config = RunConfig(
+            max_workers=int(os.getenv("RAGAS_MAX_WORKERS", "16")),
+            max_retries=3,
+            timeout=60,
+        )
+
+        # Run RAGAS evaluation
+        try:
+            result = evaluate(
+                dataset,
+                metrics=[
+                    faithfulness,
+                    answer_relevancy,
+                    context_precision,
+                    context_recall,
+                ],
+                llm=llm,
+                embeddings=embeddings,
+                run_config=run_config,
+            )
+
+            # Per-sample scores as one DataFrame; mean() skips NaN rows from failed judge calls
+            scores = result.to_pandas()
+            metric_columns = [name for name in RAGAS_METRIC_NAMES if name in scores.columns]
+            means = scores[metric_columns].mean(numeric_only=True).to_dict()
+            metric_scores = {name: means.get(name, 0.0) for name in RAGAS_METRIC_NAMES}
+
+            return {
+                **metric_scores,
+                # Overall score: RAGAS has no aggregate column, so average the four metrics
+                "ragas_score": float(np.mean(list(metric_scores.values()))),
+            }
+        except Exception as e:
+            logger.error(f"RAGAS evaluation failed: {e}")
+            return {
+                "faithfulness": 0.0,
+                "answer_relevancy": 0.0,
+                "context_precision": 0.0,
+                "context_recall": 0.0,
+                "ragas_score": 0.0,
+            }
+
+    def _get_ragas_judge(self):
+        """Build the RAGAS judge LLM and embeddings once and reuse them across evaluate() calls"""
+        if self._ragas_llm is not None:
+            return self._ragas_llm, self._ragas_embeddings
+
         # Configure explicit LLM and embeddings to avoid missing embed_query errors
         provider = os.getenv("RAGAS_LLM_PROVIDER", "openai").lower()
         gemini_key = os.getenv("GEMINI_API_KEY")
@@ -234,61 +323,17 @@ class RAGEvaluator:
             embeddings = OpenAIEmbeddings(model="text-embedding-3-small", api_key=openai_key)
             logger.info("Using OpenAI for RAGAS scoring")
 
-        # Run RAGAS evaluation
-        try:
-            result = evaluate(
-                dataset,
-                metrics=[
-                    faithfulness,
-                    answer_relevancy,
-                    context_precision,
-                    context_recall,
-                ],
-                llm=llm,
-                embeddings=embeddings,
-            )
-
-            # ragas >=0.1 may return an EvaluationResult object without .get
-            if hasattr(result, "scores"):
-                result_dict = result.scores
-            elif isinstance(result, dict):
-                result_dict = result
-            elif isinstance(result, list) and result and isinstance(result[0], dict):
-                result_dict = result[0]
-            else:
-                # Best effort: try __getitem__ for known keys
-                result_dict = {
-                    "faithfulness": result["faithfulness"],
-                    "answer_relevancy": result["answer_relevancy"],
-                    "context_precision": result["context_precision"],
-                    "context_recall": result["context_recall"],
-                }
-
-            return {
-                "faithfulness": result_dict.get("faithfulness", 0.0),
-                "answer_relevancy": result_dict.get("answer_relevancy", 0.0),
-                "context_precision": result_dict.get("context_precision", 0.0),
-                "context_recall": result_dict.get("context_recall", 0.0),
-                "ragas_score": result_dict.get("ragas_score", 0.0),  # Overall score
-            }
-        except Exception as e:
-            logger.error(f"RAGAS evaluation failed: {e}")
-            return {
-                "faithfulness": 0.0,
-                "answer_relevancy": 0.0,
-                "context_precision": 0.0,
-                "context_recall": 0.0,
-                "ragas_score": 0.0,
-            }
+        self._ragas_llm, self._ragas_embeddings = llm, embeddings
+        return llm, embeddings
 
     def _calculate_ranking_metrics(
-        self, responses: List[RAGResponse], relevant_doc_ids: List[List[str]]
+        self, retrieved_documents: List[List[Dict[str, Any]]], relevant_doc_ids: List[Set[str]]
     ) -> Dict[str, float]:
         """
         Calculate MRR and Hit Rate@k.
 
         Args:
-            responses: List of RAG responses
+            retrieved_documents: Source documents returned for each query, in rank order
             relevant_doc_ids: List of relevant document IDs for each query
 
         Returns:
@@ -302,34 +347,31 @@ class RAGEvaluator:
         hits_at_5 = 0
         hits_at_10 = 0
 
-        for response, relevant_ids in zip(responses, relevant_doc_ids):
-            # Extract document IDs from retrieved documents
-            retrieved_ids = [doc.get("arxiv_id", doc.get("id", "")) for doc in response.source_documents]
+        for documents, relevant_ids in zip(retrieved_documents, relevant_doc_ids):
+            # Datasets loaded by run_benchmark already hold sets; plain lists are converted here
+            relevant = relevant_ids if isinstance(relevant_ids, (set, frozenset)) else set(relevant_ids)
 
-            # Find rank of first relevant document
+            # Find rank of first relevant document in a single pass over the retrieved documents
             first_relevant_rank = None
-            for rank, doc_id in enumerate(retrieved_ids, start=1):
-                if doc_id in relevant_ids:
+            for rank, doc in enumerate(documents, start=1):
+                if doc.get("arxiv_id", doc.get("id", "")) in relevant:
                     first_relevant_rank = rank
                     break
 
-            # MRR calculation
-            if first_relevant_rank:
-                reciprocal_ranks.append(1.0 / first_relevant_rank)
-            else:
+            if first_relevant_rank is None:
                 reciprocal_ranks.append(0.0)
+                continue
 
-            # Hit Rate@k calculation
-            if any(doc_id in relevant_ids for doc_id in retrieved_ids[:1]):
-                hits_at_1 += 1
-            if any(doc_id in relevant_ids for doc_id in retrieved_ids[:3]):
-                hits_at_3 += 1
-            if any(doc_id in relevant_ids for doc_id in retrieved_ids[:5]):
-                hits_at_5 += 1
-            if any(doc_id in relevant_ids for doc_id in retrieved_ids[:10]):
-                hits_at_10 += 1
-
-        n = len(responses)
+            # MRR calculation
+            reciprocal_ranks.append(1.0 / first_relevant_rank)
+
+            # Hit Rate@k: a hit within the top k is the same as the first hit ranking <= k
+            hits_at_1 += first_relevant_rank <= 1
+            hits_at_3 += first_relevant_rank <= 3
+            hits_at_5 += first_relevant_rank <= 5
+            hits_at_10 += first_relevant_rank <= 10
+
+        n = len(retrieved_documents)
         return {
             "mrr": sum(reciprocal_ranks) / n if n > 0 else 0.0,
             "hit_rate@1": hits_at_1 / n if n > 0 else 0.0,
@@ -338,25 +380,24 @@ class RAGEvaluator:
             "hit_rate@10": hits_at_10 / n if n > 0 else 0.0,
         }
 
-    def _calculate_latency_metrics(self, latencies: List[float]) -> Dict[str, float]:
-        """Calculate latency percentiles"""
-        if not latencies:
+    def _calculate_latency_metrics(self, latencies: Union[List[float], np.ndarray]) -> Dict[str, float]:
+        """Calculate latency percentiles from a list or a float ndarray"""
+        if len(latencies) == 0:
             return {"avg": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0}
 
-        sorted_latencies = sorted(latencies)
-        n = len(sorted_latencies)
+        # One percentile pass instead of a full sort; interpolated like get_real_metrics
+        latency_array = np.asarray(latencies, dtype=np.float64)
+        p50, p95, p99 = np.percentile(latency_array, [50, 95, 99])
 
         return {
-            "avg": sum(latencies) / n,
-            "p50": sorted_latencies[int(n * 0.50)],
-            "p95": sorted_latencies[int(n * 0.95)],
-            "p99": sorted_latencies[int(n * 0.99)] if n > 1 else sorted_latencies[-1],
+            "avg": float(latency_array.mean()),
+            "p50": float(p50),
+            "p95": float(p95),
+            "p99": float(p99),
         }
 
-    def _calculate_cost_metrics(self, responses: List[RAGResponse]) -> Dict[str, Any]:
+    def _calculate_cost_metrics(self, total_tokens: int, n: int) -> Dict[str, Any]:
         """Calculate token usage and cost"""
-        total_tokens = sum(r.tokens_used for r in responses)
-        n = len(responses)
 
         return {
             "total_tokens": total_tokens,
@@ -404,8 +445,7 @@ class RAGEvaluator:
 
     def export_results(self, result: EvaluationResult, output_path: str):
         """Export results to JSON file"""
-        import json
-
+        # Nested layout is what compare_benchmarks and visualize_results read
         data = {
             "summary": {
                 "num_samples": result.num_samples,
@@ -432,7 +472,11 @@ class RAGEvaluator:
             },
         }
 
-        with open(output_path, "w") as f:
-            json.dump(data, f, indent=2)
+        # RAGAS scores may come back as numpy floats. Written to a temp file and renamed
+        # so an interrupted run never leaves a truncated results file behind
+        tmp_path = f"{output_path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        os.replace(tmp_path, output_path)
 
         logger.info(f"Results exported to {output_path}")
@@ -9,20 +9,22 @@ This script demonstrates how to:
 """
 
 import asyncio
-import json
 import logging
 import os
 import sys
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import List
 
-import httpx
+import orjson
+import tiktoken
 from dotenv import load_dotenv
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from benchmarks.http_client import make_async_client
 from benchmarks.rag_evaluator import RAGEvaluator, RAGResponse
 
 logging.basicConfig(level=logging.INFO)
@@ -34,18 +36,34 @@ load_dotenv()
 # Configuration
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
 COST_PER_1K_TOKENS = float(os.getenv("COST_PER_1K_TOKENS", "0.0015"))
+RAG_EVAL_CONCURRENCY = int(os.getenv("RAG_EVAL_CONCURRENCY", "8"))
+
+# Extractive answer: leading characters of the top context, or a fixed fallback
+ANSWER_MAX_CHARS = 500
+NO_ANSWER = "No answer available"
+
+# Tokenizer used for cost estimates
+TOKEN_ENCODING_NAME = "cl100k_base"
+
+
+@lru_cache(maxsize=1)
+def get_token_encoding() -> tiktoken.Encoding:
+    """Load the tokenizer on first use, so importing this module never triggers tiktoken's BPE download"""
+    return tiktoken.get_encoding(TOKEN_ENCODING_NAME)
 
 
 class RAGPipelineWrapper:
     """Wrapper for your RAG system API"""
 
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, max_connections: int = RAG_EVAL_CONCURRENCY):
         self.base_url = base_url.rstrip("/")
-        self.client = httpx.AsyncClient(timeout=60.0)
+        # Pool sized to the evaluator's concurrency so in-flight questions reuse connections
+        self.client = make_async_client(timeout=60.0, max_connections=max_connections)
 
     async def query(self, question: str, use_hybrid: bool = True, top_k: int = 5) -> RAGResponse:
         """Query the live /hybrid-search endpoint and build contexts for RAGAS."""
-        start_time = time.time()
+        # Monotonic clock: wall-clock adjustments cannot skew latencies
+        start_ns = time.perf_counter_ns()
 
         try:
             response = await self.client.post(
@@ -57,9 +75,9 @@ class RAGPipelineWrapper:
                 },
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
             hits = data.get("hits", [])
             contexts = [h.get("chunk_text", "") for h in hits if h.get("chunk_text")]
@@ -78,7 +96,9 @@ class RAGPipelineWrapper:
             # If the endpoint does not generate an answer, create a simple extractive one
             answer = self._generate_answer(question, contexts)
 
-            tokens_used = len(question + answer + " ".join(contexts)) // 4
+            # Count each piece separately rather than concatenating everything first
+            encoded = get_token_encoding().encode_ordinary_batch([question, answer, *contexts])
+            tokens_used = sum(len(tokens) for tokens in encoded)
 
             return RAGResponse(
                 answer=answer,
@@ -101,7 +121,9 @@ class RAGPipelineWrapper:
         If you have an /ask endpoint with LLM generation, use that instead.
         """
         # Simple extractive approach for now
-        return contexts[0][:500] if contexts else "No answer available"
+        if not contexts:
+            return NO_ANSWER
+        return contexts[0][:ANSWER_MAX_CHARS]
 
     async def close(self):
         """Close HTTP client"""
@@ -120,8 +142,14 @@ async def load_evaluation_dataset(dataset_path: str) -> dict:
         "ground_truth_contexts": [["context 1"], ["context 2"]]  // Optional
     }
     """
-    with open(dataset_path, "r") as f:
-        return json.load(f)
+    with open(dataset_path, "rb") as f:
+        dataset = orjson.loads(f.read())
+
+    # Ranking metrics only do membership checks, so build the sets once here
+    if "relevant_doc_ids" in dataset:
+        dataset["relevant_doc_ids"] = [set(doc_ids) for doc_ids in dataset["relevant_doc_ids"]]
+
+    return dataset
 
 
 async def main():
@@ -143,7 +171,9 @@ async def main():
 
     # Initialize evaluator
     evaluator = RAGEvaluator(
-        rag_pipeline=rag_pipeline.query, cost_per_1k_tokens=COST_PER_1K_TOKENS
+        rag_pipeline=rag_pipeline.query,
+        cost_per_1k_tokens=COST_PER_1K_TOKENS,
+        max_concurrency=RAG_EVAL_CONCURRENCY,
     )
 
     # Run evaluation
@@ -4,18 +4,23 @@ Uses the /ask endpoint with document_type: "financial"
 """
 
 import asyncio
-import json
 import logging
 import os
+import queue
 import sys
 import time
+from dataclasses import replace
 from pathlib import Path
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Tuple
 
-import httpx
+import numpy as np
+import orjson
 from dotenv import load_dotenv
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
+from benchmarks.http_client import HTTP2_AVAILABLE, make_async_client
 from benchmarks.rag_evaluator import RAGEvaluator, RAGResponse
 
 logging.basicConfig(level=logging.INFO)
@@ -24,6 +29,17 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 
 API_BASE_URL = os.getenv("API_BASE_URL", "https://arxiv-paper-curator-v1-production.up.railway.app/api/v1")
+RAG_EVAL_CONCURRENCY = int(os.getenv("RAG_EVAL_CONCURRENCY", "8"))
+
+
+def start_log_listener() -> QueueListener:
+    """Route root log records through a queue so concurrent queries never block on stderr writes"""
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
 
 
 class FinancialRAGWrapper:
@@ -31,11 +47,37 @@ class FinancialRAGWrapper:
 
     def __init__(self, base_url: str):
         self.base_url = base_url.rstrip("/")
-        self.client = httpx.AsyncClient(timeout=120.0)
+        # One warm pool for the whole run; idle connections outlive the RAGAS scoring phase
+        self.client = make_async_client(timeout=120.0, keepalive_expiry=300.0)
+        # Repeated (question, ticker) pairs within a run share one request
+        self._requests: Dict[Tuple[str, Optional[str]], asyncio.Task] = {}
 
     async def query(self, question: str, ticker: str = None) -> RAGResponse:
-        """Query /ask endpoint with document_type: financial"""
-        start_time = time.time()
+        """Query /ask endpoint with document_type: financial, reusing the result of identical queries.
+
+        Reused results are copies flagged cached=True, so one request is only counted once in latency stats.
+        """
+        key = (question, ticker)
+        task = self._requests.get(key)
+        cached = task is not None
+        if not cached:
+            task = asyncio.ensure_future(self._ask(question, ticker))
+            self._requests[key] = task
+
+        try:
+            response = await task
+        except Exception:
+            # Let a later duplicate retry instead of replaying the failure
+            if self._requests.get(key) is task:
+                del self._requests[key]
+            raise
+
+        return replace(response, cached=True) if cached else response
+
+    async def _ask(self, question: str, ticker: str = None) -> RAGResponse:
+        """POST a single question to /ask"""
+        # Monotonic clock: wall-clock adjustments cannot skew latencies
+        start_ns = time.perf_counter_ns()
 
         try:
             payload = {
@@ -52,9 +94,9 @@ class FinancialRAGWrapper:
                 json=payload,
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
-            latency_ms = (time.time() - start_time) * 1000
+            latency_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
             return RAGResponse(
                 answer=data.get("answer", ""),
@@ -78,32 +120,48 @@ async def run_financial_benchmark():
 
     # Load dataset
     dataset_path = Path(__file__).parent / "data" / "financial_dataset.json"
-    with open(dataset_path) as f:
-        dataset = json.load(f)
+    with open(dataset_path, "rb") as f:
+        dataset = orjson.loads(f.read())
 
     questions = dataset["questions"]
     ground_truths = dataset["ground_truths"]
     tickers = dataset.get("tickers", [None] * len(questions))
+    # Built once for the results file and the summary; questions without a ticker are skipped.
+    # dict.fromkeys keeps first-seen order so results files are stable across runs
+    companies_tested = list(dict.fromkeys(ticker for ticker in tickers if ticker))
 
     logger.info(f"Running benchmark on {len(questions)} financial questions...")
+    if HTTP2_AVAILABLE:
+        logger.info("HTTP/2 enabled: concurrent queries share multiplexed connections")
+    else:
+        logger.info('HTTP/2 unavailable, using HTTP/1.1 keep-alive (pip install "httpx[http2]" to enable)')
 
     # Initialize
     rag = FinancialRAGWrapper(API_BASE_URL)
     evaluator = RAGEvaluator(rag_pipeline=rag.query)
 
-    responses = []
-    all_contexts = []
+    # Run queries concurrently, bounded by the semaphore; results keep question order
+    semaphore = asyncio.Semaphore(RAG_EVAL_CONCURRENCY)
 
-    # Run queries
-    for i, (question, ticker) in enumerate(zip(questions, tickers)):
-        logger.info(f"[{i+1}/{len(questions)}] Querying: {question[:50]}...")
-        try:
+    async def run_query(i: int, question: str, ticker: str) -> RAGResponse:
+        async with semaphore:
+            logger.info("[%d/%d] Querying: %.50s...", i + 1, len(questions), question)
             response = await rag.query(question, ticker)
-            responses.append(response)
-            all_contexts.append(response.contexts)
-            logger.info(f"  ✓ Got answer ({response.latency_ms:.0f}ms)")
-        except Exception as e:
-            logger.error(f"  ✗ Failed: {e}")
+            if response.cached:
+                logger.info("  ✓ [%d] Reused answer of an identical query", i + 1)
+            else:
+                logger.info("  ✓ [%d] Got answer (%.0fms)", i + 1, response.latency_ms)
+            return response
+
+    results = await asyncio.gather(
+        *(run_query(i, question, ticker) for i, (question, ticker) in enumerate(zip(questions, tickers))),
+        return_exceptions=True,
+    )
+
+    responses = []
+    for i, result in enumerate(results):
+        if isinstance(result, Exception):
+            logger.error("  ✗ [%d] Failed: %s", i + 1, result)
             responses.append(RAGResponse(
                 answer="Error",
                 contexts=[],
@@ -112,33 +170,38 @@ async def run_financial_benchmark():
                 tokens_used=0,
                 model_used="error"
             ))
-            all_contexts.append([])
+        else:
+            responses.append(result)
 
     await rag.close()
 
     # Calculate RAGAS metrics (now that API returns context_chunks)
     logger.info("Calculating RAGAS metrics...")
-    valid_indices = [i for i, r in enumerate(responses) if r.answer != "Error" and r.contexts]
+    # One pass keeps only answered queries with contexts, then transposes into RAGAS columns
+    valid = [
+        (question, response.answer, response.contexts, ground_truth)
+        for question, response, ground_truth in zip(questions, responses, ground_truths)
+        if response.answer != "Error" and response.contexts
+    ]
 
-    if valid_indices:
-        valid_questions = [questions[i] for i in valid_indices]
-        valid_responses = [responses[i] for i in valid_indices]
-        valid_ground_truths = [ground_truths[i] for i in valid_indices]
+    if valid:
+        valid_questions, valid_answers, valid_contexts, valid_ground_truths = map(list, zip(*valid))
 
         try:
             ragas_scores = await evaluator._calculate_ragas_scores(
                 questions=valid_questions,
-                responses=valid_responses,
+                answers=valid_answers,
+                contexts=valid_contexts,
                 ground_truths=valid_ground_truths,
                 ground_truth_contexts=None
             )
-            ragas_scores["successful_queries"] = len(valid_indices)
+            ragas_scores["successful_queries"] = len(valid)
             ragas_scores["total_queries"] = len(questions)
         except Exception as e:
             logger.error(f"RAGAS scoring failed: {e}")
             ragas_scores = {
                 "error": str(e),
-                "successful_queries": len(valid_indices),
+                "successful_queries": len(valid),
                 "total_queries": len(questions)
             }
     else:
@@ -148,9 +211,9 @@ async def run_financial_benchmark():
             "total_queries": len(questions)
         }
 
-    # Calculate latency metrics
-    latencies = [r.latency_ms for r in responses if r.latency_ms > 0]
-    latency_metrics = evaluator._calculate_latency_metrics(latencies) if latencies else {}
+    # Calculate latency metrics over requests actually sent, not reused duplicates
+    latencies = np.fromiter((r.latency_ms for r in responses if r.latency_ms > 0 and not r.cached), dtype=np.float64)
+    latency_metrics = evaluator._calculate_latency_metrics(latencies) if latencies.size else {}
 
     # Simple retrieval metrics
     retrieval_metrics = {"note": "Retrieval metrics require relevant doc IDs"}
@@ -163,21 +226,23 @@ async def run_financial_benchmark():
         "ragas_scores": ragas_scores,
         "retrieval_metrics": retrieval_metrics,
         "latency_metrics": latency_metrics,
-        "companies_tested": list(set(tickers)),
+        "companies_tested": companies_tested,
     }
 
     # Save results
     output_path = Path(__file__).parent / "results" / f"financial_benchmark_{int(time.time())}.json"
     output_path.parent.mkdir(exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(results, f, indent=2, default=str)
+    # Write to a temp file and rename so an interrupted run never leaves a truncated results file
+    tmp_path = output_path.with_suffix(".json.tmp")
+    tmp_path.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY, default=str))
+    os.replace(tmp_path, output_path)
 
     # Print summary
     print("\n" + "=" * 60)
     print("FINANCIAL RAG BENCHMARK RESULTS")
     print("=" * 60)
     print(f"\nQuestions: {len(questions)}")
-    print(f"Companies: {', '.join(set(tickers))}")
+    print(f"Companies: {', '.join(companies_tested)}")
     print(f"\nRAGAS Scores:")
     for key, value in ragas_scores.items():
         if isinstance(value, (int, float)):
@@ -192,4 +257,9 @@ async def run_financial_benchmark():
 
 
 if __name__ == "__main__":
-    asyncio.run(run_financial_benchmark())
+    log_listener = start_log_listener()
+    try:
+        asyncio.run(run_financial_benchmark())
+    finally:
+        # Flush queued records before exiting
+        log_listener.stop()
@@ -7,9 +7,10 @@ This script demonstrates:
 3. Chunking and embedding financial documents
 4. Indexing into OpenSearch for hybrid search
 
-Run: uv run python scripts/index_financial_docs.py
+Run: uv run python scripts/index_financial_docs.py [--yes] [--force]
 """
 
+import argparse
 import asyncio
 import sys
 import logging
@@ -22,7 +23,9 @@ sys.path.insert(0, str(project_root))
 from src.db.factory import make_database
 from src.repositories.financial_document import FinancialDocumentRepository
 from src.services.opensearch.financial_factory import make_financial_opensearch_client
+from src.services.opensearch.ingest_mode import bulk_ingest_mode
 from src.services.indexing.financial_factory import make_financial_indexing_service
+from src.utils.event_loop import run_with_uvloop
 
 # Setup logging
 logging.basicConfig(
@@ -31,6 +34,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Documents fetched, chunked and embedded per round; bounds how many full_text values are in memory
+PAGE_SIZE = 50
+
 
 def print_separator(char="=", length=70):
     """Print a separator line."""
@@ -77,8 +83,27 @@ async def setup_index():
     return True
 
 
-async def index_documents():
-    """Index unindexed financial documents."""
+def to_index_document(doc) -> dict:
+    """Copy the fields the indexing service needs out of a FinancialDocument row."""
+    return {
+        "id": doc.id,
+        "ticker_symbol": doc.ticker_symbol,
+        "company_name": doc.company_name,
+        "cik": doc.cik,
+        "document_type": doc.document_type,
+        "fiscal_year": doc.fiscal_year,
+        "fiscal_period": doc.fiscal_period,
+        "filing_date": doc.filing_date,
+        "accession_number": doc.accession_number,
+        "full_text": doc.full_text,
+    }
+
+
+async def index_documents(replace_existing: bool = False):
+    """Index unindexed financial documents.
+
+    :param replace_existing: Delete each document's existing chunks before indexing it
+    """
     print_separator()
     print("STEP 2: Index Financial Documents")
     print_separator()
@@ -89,45 +114,19 @@ async def index_documents():
         with db.get_session() as session:
             repo = FinancialDocumentRepository(session)
 
-            # Get unindexed documents
-            print("\n🔍 Fetching unindexed documents from database...")
-            unindexed_docs = repo.get_unindexed_documents()
+            # Stream unindexed documents a page at a time instead of loading every full_text at once
+            print("\n🔍 Streaming unindexed documents from database...")
+            pages = repo.iter_unindexed_documents(page_size=PAGE_SIZE)
+            page = await asyncio.to_thread(next, pages, None)
 
-            if not unindexed_docs:
+            if not page:
                 print("ℹ️  No unindexed documents found!")
                 return
 
-            print(f"✅ Found {len(unindexed_docs)} unindexed documents:\n")
-
-            for i, doc in enumerate(unindexed_docs, 1):
-                print(f"   {i}. {doc.company_name} ({doc.ticker_symbol})")
-                print(f"      Type: {doc.document_type}")
-                print(f"      Filed: {doc.filing_date.strftime('%Y-%m-%d')}")
-                print(f"      Size: {doc.document_size_kb} KB")
-                print()
-
             # Create indexing service
             print("🔧 Creating indexing service...")
             service = make_financial_indexing_service()
 
-            # Convert SQLAlchemy objects to dicts
-            print("\n📦 Preparing documents for indexing...")
-            documents = []
-            for doc in unindexed_docs:
-                documents.append({
-                    "id": doc.id,
-                    "ticker_symbol": doc.ticker_symbol,
-                    "company_name": doc.company_name,
-                    "cik": doc.cik,
-                    "document_type": doc.document_type,
-                    "fiscal_year": doc.fiscal_year,
-                    "fiscal_period": doc.fiscal_period,
-                    "filing_date": doc.filing_date,
-                    "accession_number": doc.accession_number,
-                    "full_text": doc.full_text,
-                })
-
-            # Index documents
             print("\n🚀 Starting indexing process...")
             print("   This will:")
             print("   1. Chunk each document (600 words, 100 overlap)")
@@ -135,10 +134,42 @@ async def index_documents():
             print("   3. Index into OpenSearch")
             print()
 
-            stats = await service.index_documents_batch(
-                documents=documents,
-                replace_existing=False
-            )
+            stats = {
+                "documents_processed": 0,
+                "total_chunks_created": 0,
+                "total_chunks_indexed": 0,
+                "total_embeddings_generated": 0,
+                "total_errors": 0,
+            }
+            # document_id -> chunk_count for documents that indexed cleanly; marked once the cursor is exhausted
+            indexed = {}
+            seen = 0
+
+            # Pause refreshes and replica writes while chunks are loaded; bulk_ingest_mode refreshes once on exit
+            with bulk_ingest_mode(service.opensearch_client.client, service.opensearch_client.index_name):
+                while page:
+                    for doc in page:
+                        seen += 1
+                        print(f"   {seen}. {doc.company_name} ({doc.ticker_symbol})")
+                        print(f"      Type: {doc.document_type}")
+                        print(f"      Filed: {doc.filing_date.strftime('%Y-%m-%d')}")
+                        print(f"      Size: {doc.document_size_kb} KB")
+                        print()
+
+                    documents = [to_index_document(doc) for doc in page]
+
+                    # Fetch the next page while this one is chunked, embedded and indexed
+                    next_page = asyncio.create_task(asyncio.to_thread(next, pages, None))
+                    page_stats = await service.index_documents_batch(
+                        documents=documents,
+                        replace_existing=replace_existing,
+                        refresh=False
+                    )
+                    page = await next_page
+
+                    for key in stats:
+                        stats[key] += page_stats[key]
+                    indexed.update(page_stats["per_document_chunks"])
 
             print_separator("=")
             print("✅ INDEXING COMPLETE!")
@@ -151,18 +182,10 @@ async def index_documents():
             print(f"   Total embeddings generated: {stats['total_embeddings_generated']}")
             print(f"   Errors: {stats['total_errors']}")
 
-            if stats['total_errors'] == 0:
+            if indexed:
                 # Mark documents as indexed in database
                 print("\n✅ Marking documents as indexed in database...")
-                for doc in unindexed_docs:
-                    # Calculate chunk count for this document
-                    doc_stats = [d for d in documents if d["id"] == doc.id]
-                    chunk_count = stats['total_chunks_created'] // len(documents)
-
-                    repo.mark_as_indexed(
-                        document_id=doc.id,
-                        chunk_count=chunk_count
-                    )
+                repo.mark_many_as_indexed(indexed)
 
                 print("✅ Database updated!")
 
@@ -205,8 +228,8 @@ async def verify_indexing():
         db.teardown()
 
 
-async def main():
-    """Run all steps."""
+def confirm(assume_yes: bool) -> None:
+    """Describe the run and wait for Enter, unless --yes was given or nobody is at a terminal."""
     print_separator("=")
     print("🧪 FINANCIAL DOCUMENTS INDEXING")
     print_separator("=")
@@ -218,8 +241,13 @@ async def main():
     print("  4. Index into OpenSearch for hybrid search")
     print()
 
-    input("Press Enter to continue (or Ctrl+C to cancel)...")
+    # Prompt before the event loop starts; cron/CI runs have no TTY and proceed straight away
+    if not assume_yes and sys.stdin.isatty():
+        input("Press Enter to continue (or Ctrl+C to cancel)...")
+
 
+async def main(replace_existing: bool = False):
+    """Run all steps."""
     try:
         # Step 1: Setup index
         success = await setup_index()
@@ -228,7 +256,7 @@ async def main():
             return
 
         # Step 2: Index documents
-        await index_documents()
+        await index_documents(replace_existing=replace_existing)
 
         # Step 3: Verify
         await verify_indexing()
@@ -258,4 +286,19 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Index financial documents into OpenSearch")
+    parser.add_argument("--yes", action="store_true", help="Skip the confirmation prompt")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Delete each document's existing chunks before indexing it",
+    )
+    args = parser.parse_args()
+
+    try:
+        confirm(args.yes)
+    except KeyboardInterrupt:
+        print("\n\n❌ Indexing cancelled by user")
+        sys.exit(1)
+
+    run_with_uvloop(main(replace_existing=args.force))
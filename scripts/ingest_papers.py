@@ -15,21 +15,31 @@ Usage:
 import asyncio
 import argparse
 import logging
+from datetime import datetime
 from pathlib import Path
 import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Set
+
+from dateutil import parser as date_parser
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config import get_settings
-from src.services.arxiv.client import ArxivClient
-from src.services.pdf_parser.client import PDFParserClient
+from src.schemas.arxiv.paper import ArxivPaper
+from src.schemas.pdf_parser.models import PdfContent
+from src.services.arxiv.factory import make_arxiv_client
+from src.services.pdf_parser.factory import make_pdf_parser_service
 from src.services.indexing.text_chunker import TextChunker
 from src.services.embeddings.factory import make_embeddings_service
 from src.services.opensearch.factory import make_opensearch_client
 from src.models.paper import Paper
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from src.utils.event_loop import run_with_uvloop
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import Engine
 
 logging.basicConfig(
     level=logging.INFO,
@@ -38,6 +48,24 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def to_search_query(query: str) -> str:
+    """Search all fields for free text; queries that already use arXiv field prefixes (e.g. "cat:cs.AI") pass through."""
+    return query if ":" in query else f"all:{query}"
+
+
+def load_existing_ids(engine: Engine, arxiv_ids: List[str]) -> Set[str]:
+    """Return which of the given arxiv_ids are already stored."""
+    with engine.connect() as conn:
+        return set(conn.scalars(select(Paper.arxiv_id).where(Paper.arxiv_id.in_(arxiv_ids))))
+
+
+def insert_papers(engine: Engine, rows: List[Dict[str, Any]]) -> Set[str]:
+    """Insert paper rows in a single executemany, returning the arxiv_ids actually inserted."""
+    stmt = insert(Paper).on_conflict_do_nothing(index_elements=[Paper.arxiv_id]).returning(Paper.arxiv_id)
+    with engine.begin() as conn:
+        return set(conn.scalars(stmt, rows))
+
+
 async def ingest_papers(query: str, max_results: int = 10):
     """Fetch and ingest papers from arXiv."""
 
@@ -45,117 +73,157 @@ async def ingest_papers(query: str, max_results: int = 10):
     settings = get_settings()
     logger.info(f"Connecting to database: {settings.postgres_database_url[:30]}...")
 
-    # Create database session
     engine = create_engine(settings.postgres_database_url)
-    SessionLocal = sessionmaker(bind=engine)
-    db = SessionLocal()
+    embeddings_service = make_embeddings_service()
 
     try:
         # Initialize services
-        arxiv_client = ArxivClient(settings.arxiv)
-        pdf_parser = PDFParserClient(settings.pdf_parser)
-        text_chunker = TextChunker(settings.chunking)
-        embeddings_service = await make_embeddings_service()
+        arxiv_client = make_arxiv_client()
+        pdf_parser = make_pdf_parser_service()
+        text_chunker = TextChunker(
+            chunk_size=settings.chunking.chunk_size,
+            overlap_size=settings.chunking.overlap_size,
+            min_chunk_size=settings.chunking.min_chunk_size,
+        )
         opensearch_client = make_opensearch_client()
 
         logger.info(f"Fetching papers with query: '{query}', max_results: {max_results}")
 
         # Fetch papers from arXiv
-        papers_data = arxiv_client.search(
-            query=query,
+        papers = await arxiv_client.fetch_papers_with_query(
+            search_query=to_search_query(query),
             max_results=max_results,
             sort_by="relevance"
         )
 
-        logger.info(f"Found {len(papers_data)} papers")
+        logger.info(f"Found {len(papers)} papers")
 
-        papers_processed = 0
+        # One IN query for every fetched id instead of a lookup per paper
+        existing_ids = await asyncio.to_thread(load_existing_ids, engine, [paper.arxiv_id for paper in papers])
 
-        for paper_data in papers_data:
-            try:
-                arxiv_id = paper_data.get("arxiv_id")
-                logger.info(f"Processing paper: {arxiv_id}")
+        new_papers = []
+        for paper in papers:
+            if paper.arxiv_id in existing_ids:
+                logger.info(f"Paper {paper.arxiv_id} already exists, skipping")
+            else:
+                new_papers.append(paper)
+
+        # Download and parse PDFs concurrently: downloads share the client's connection pool and are
+        # capped like MetadataFetcher's so arxiv.org sees a bounded request rate; parsing blocks so it
+        # runs on worker threads, as many as MetadataFetcher allows to parse at once
+        loop = asyncio.get_running_loop()
+        download_semaphore = asyncio.Semaphore(settings.arxiv.max_concurrent_downloads)
 
-                # Check if paper already exists
-                existing = db.query(Paper).filter(Paper.arxiv_id == arxiv_id).first()
-                if existing:
-                    logger.info(f"Paper {arxiv_id} already exists, skipping")
-                    continue
+        with ThreadPoolExecutor(max_workers=settings.arxiv.max_concurrent_parsing) as executor:
 
-                # Download and parse PDF
-                pdf_path = arxiv_client.download_pdf(paper_data)
+            async def fetch_and_parse(paper: ArxivPaper) -> PdfContent:
+                async with download_semaphore:
+                    pdf_path = await arxiv_client.download_pdf(paper)
+                if pdf_path is None:
+                    raise RuntimeError("PDF download failed")
                 logger.info(f"Downloaded PDF to: {pdf_path}")
+                # Docling's parse_pdf is a coroutine that converts synchronously, so run it on the
+                # worker thread's own event loop instead of blocking this one
+                pdf_content = await loop.run_in_executor(executor, asyncio.run, pdf_parser.parse_pdf(pdf_path))
+                logger.info(f"Parsed {len(pdf_content.sections)} sections")
+                return pdf_content
 
-                # Parse PDF
-                parsed_content = pdf_parser.parse_pdf(str(pdf_path))
-                logger.info(f"Parsed {len(parsed_content.get('sections', []))} sections")
+            try:
+                parsed_results = await asyncio.gather(*(fetch_and_parse(paper) for paper in new_papers), return_exceptions=True)
+            finally:
+                await arxiv_client.aclose()
 
-                # Create paper object
-                paper = Paper(
-                    arxiv_id=arxiv_id,
-                    title=paper_data.get("title"),
-                    authors=paper_data.get("authors", []),
-                    abstract=paper_data.get("abstract"),
-                    categories=paper_data.get("categories", []),
-                    published_date=paper_data.get("published"),
-                    pdf_url=paper_data.get("pdf_url"),
-                    entry_id=paper_data.get("entry_id"),
-                    updated_date=paper_data.get("updated"),
-                    comment=paper_data.get("comment"),
-                    journal_ref=paper_data.get("journal_ref"),
-                    doi=paper_data.get("doi"),
-                    primary_category=paper_data.get("primary_category"),
-                )
+        paper_rows = []
+        index_items = []
+
+        for paper, pdf_content in zip(new_papers, parsed_results):
+            try:
+                arxiv_id = paper.arxiv_id
+                logger.info(f"Processing paper: {arxiv_id}")
 
-                # Save to database
-                db.add(paper)
-                db.commit()
-                db.refresh(paper)
-                logger.info(f"Saved paper to database with ID: {paper.id}")
+                if isinstance(pdf_content, Exception):
+                    raise pdf_content
+
+                sections = [{"title": section.title, "content": section.content} for section in pdf_content.sections]
+
+                # Queue the paper row; all new papers are inserted in one statement after the loop
+                paper_id = uuid.uuid4()
+                paper_rows.append({
+                    "id": paper_id,
+                    "arxiv_id": arxiv_id,
+                    "title": paper.title,
+                    "authors": paper.authors,
+                    "abstract": paper.abstract,
+                    "categories": paper.categories,
+                    "published_date": date_parser.parse(paper.published_date),
+                    "pdf_url": paper.pdf_url,
+                    "raw_text": pdf_content.raw_text,
+                    "sections": sections,
+                    "references": list(pdf_content.references),
+                    "parser_used": pdf_content.parser_used.value,
+                    "parser_metadata": pdf_content.metadata or {},
+                    "pdf_processed": True,
+                    "pdf_processing_date": datetime.now(),
+                })
 
                 # Chunk the content
-                chunks = text_chunker.chunk_sections(
-                    sections=parsed_content.get("sections", []),
-                    metadata={
-                        "arxiv_id": arxiv_id,
-                        "title": paper_data.get("title"),
-                        "authors": paper_data.get("authors", []),
-                    }
+                chunks = text_chunker.chunk_paper(
+                    title=paper.title,
+                    abstract=paper.abstract,
+                    full_text=pdf_content.raw_text,
+                    arxiv_id=arxiv_id,
+                    paper_id=str(paper_id),
+                    sections=sections,
                 )
                 logger.info(f"Created {len(chunks)} chunks")
 
-                # Generate embeddings and index to OpenSearch
-                for chunk in chunks:
-                    # Generate embedding
-                    embedding = await embeddings_service.embed_query(chunk["chunk_text"])
-
-                    # Index to OpenSearch
-                    opensearch_client.index_chunk(
-                        arxiv_id=arxiv_id,
-                        chunk_text=chunk["chunk_text"],
-                        chunk_index=chunk["chunk_index"],
-                        section_title=chunk.get("section_title", ""),
-                        embedding=embedding,
-                        metadata={
-                            "paper_id": paper.id,
-                            "title": paper_data.get("title"),
-                            "authors": paper_data.get("authors", []),
-                            "abstract": paper_data.get("abstract"),
-                            "categories": paper_data.get("categories", []),
-                        }
-                    )
+                # Generate all chunk embeddings in batched passage requests instead of one call per chunk
+                embeddings = await embeddings_service.embed_passages([chunk.text for chunk in chunks])
+
+                # Queue for OpenSearch; everything is sent in bulk once all papers are processed
+                for chunk, embedding in zip(chunks, embeddings):
+                    index_items.append({
+                        "id": f"{arxiv_id}-{chunk.metadata.chunk_index}",
+                        "chunk_data": {
+                            "arxiv_id": arxiv_id,
+                            "chunk_text": chunk.text,
+                            "chunk_index": chunk.metadata.chunk_index,
+                            "section_title": chunk.metadata.section_title or "",
+                            "paper_id": str(paper_id),
+                            "title": paper.title,
+                            "authors": paper.authors,
+                            "abstract": paper.abstract,
+                            "categories": paper.categories,
+                        },
+                        "embedding": embedding,
+                    })
 
                 logger.info(f"✅ Successfully processed paper: {arxiv_id}")
-                papers_processed += 1
 
             except Exception as e:
-                logger.error(f"Error processing paper {paper_data.get('arxiv_id')}: {e}")
+                logger.error(f"Error processing paper {paper.arxiv_id}: {e}")
                 continue
 
-        logger.info(f"\n🎉 Ingestion complete! Processed {papers_processed}/{len(papers_data)} papers")
+        # Save to database without blocking the event loop
+        inserted = await asyncio.to_thread(insert_papers, engine, paper_rows) if paper_rows else set()
+        logger.info(f"Saved {len(inserted)} papers to database")
+        papers_processed = len(inserted)
+
+        # Index to OpenSearch, skipping papers another run inserted in the meantime
+        index_items = [item for item in index_items if item["chunk_data"]["arxiv_id"] in inserted]
+        if index_items:
+            try:
+                results = opensearch_client.bulk_index_chunks(index_items)
+                logger.info(f"Indexed {results['success']} chunks, {results['failed']} failed")
+            except Exception as e:
+                logger.error(f"Error bulk indexing {len(index_items)} chunks: {e}")
+
+        logger.info(f"\n🎉 Ingestion complete! Processed {papers_processed}/{len(papers)} papers")
 
     finally:
-        db.close()
+        # Release the embeddings connection pool
+        await embeddings_service.close()
+        engine.dispose()
 
 
 def main():
@@ -164,7 +232,7 @@ def main():
         "--query",
         type=str,
         default="machine learning",
-        help="Search query for arXiv papers"
+        help='Search query for arXiv papers; free text searches all fields, or use arXiv syntax such as "cat:cs.AI"'
     )
     parser.add_argument(
         "--max-results",
@@ -176,7 +244,7 @@ def main():
     args = parser.parse_args()
 
     # Run async ingestion
-    asyncio.run(ingest_papers(args.query, args.max_results))
+    run_with_uvloop(ingest_papers(args.query, args.max_results))
 
 
 if __name__ == "__main__":
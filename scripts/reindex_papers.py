@@ -13,10 +13,17 @@ Usage:
 """
 
 import asyncio
+import hashlib
 import logging
+import os
+import queue
+import sqlite3
+from array import array
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 import sys
 import json
+from typing import Iterator, List, Optional, Set, Tuple
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -24,9 +31,11 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.config import get_settings
 from src.services.embeddings.factory import make_embeddings_service
 from src.services.opensearch.factory import make_opensearch_client
+from src.services.opensearch.ingest_mode import bulk_ingest_mode
 from src.models.paper import Paper
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from src.utils.event_loop import run_with_uvloop
+from sqlalchemy import Row, create_engine, select
+from sqlalchemy.engine import Engine
 
 logging.basicConfig(
     level=logging.INFO,
@@ -34,6 +43,169 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Chunks per embeddings request, and how many requests may be in flight at once
+EMBED_BATCH_SIZE = 64
+EMBED_CONCURRENCY = 8
+
+# Papers streamed from PostgreSQL per round; one page fills every concurrent embedding batch
+PAPER_PAGE_SIZE = EMBED_BATCH_SIZE * EMBED_CONCURRENCY
+
+# Embeddings of unchanged chunk texts are reused across runs; the namespace invalidates the cache
+# when the embedding model or task changes
+EMBED_CACHE_PATH = Path(
+    os.getenv("EMBED_CACHE_PATH", Path.home() / ".cache" / "arxiv-curator" / "embed_cache.sqlite")
+)
+EMBED_CACHE_NAMESPACE = "jina-embeddings-v3/retrieval.passage/1024"
+
+
+def open_embed_cache(path: Path) -> sqlite3.Connection:
+    """Open (creating if needed) the local chunk-text-hash -> embedding cache."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    cache = sqlite3.connect(path)
+    cache.execute("CREATE TABLE IF NOT EXISTS embeddings (hash BLOB PRIMARY KEY, vector BLOB NOT NULL)")
+    return cache
+
+
+def _embed_cache_key(text: str) -> bytes:
+    return hashlib.blake2b(f"{EMBED_CACHE_NAMESPACE}\0{text}".encode(), digest_size=32).digest()
+
+
+def load_cached_embedding(cache: sqlite3.Connection, text: str) -> Optional[List[float]]:
+    """Return the cached embedding for a chunk text, or None on a miss."""
+    row = cache.execute("SELECT vector FROM embeddings WHERE hash = ?", (_embed_cache_key(text),)).fetchone()
+    if row is None:
+        return None
+    vector = array("f")
+    vector.frombytes(row[0])
+    return vector.tolist()
+
+
+def store_cached_embeddings(cache: sqlite3.Connection, texts: List[str], embeddings: List[List[float]]) -> None:
+    """Cache freshly computed embeddings as float32 blobs keyed by text hash."""
+    with cache:
+        cache.executemany(
+            "INSERT OR REPLACE INTO embeddings (hash, vector) VALUES (?, ?)",
+            [(_embed_cache_key(text), array("f", embedding).tobytes()) for text, embedding in zip(texts, embeddings)],
+        )
+
+
+def iter_paper_pages(engine: Engine, page_size: int) -> Iterator[List[Row]]:
+    """Stream the paper columns needed for chunking in pages over a server-side cursor.
+
+    Parsed PDF content is skipped and only one page of rows is held in memory at a time.
+    """
+    stmt = select(
+        Paper.id,
+        Paper.arxiv_id,
+        Paper.title,
+        Paper.abstract,
+        Paper.authors,
+        Paper.categories,
+        Paper.published_date,
+    ).execution_options(yield_per=page_size)
+    with engine.connect() as conn:
+        yield from conn.execute(stmt).partitions()
+
+
+async def index_paper_page(papers, embeddings_service, opensearch_client, embed_cache) -> Tuple[Set[str], int, int]:
+    """Chunk, embed and bulk index one page of papers.
+
+    :returns: arxiv_ids indexed, chunk errors, papers skipped for lack of content
+    """
+    error_count = 0
+
+    # Build every chunk up front so embeddings can be batched across the page
+    pairs = []
+    skipped_count = 0
+    for paper in papers:
+        # Create chunks from abstract (since we don't have the full content)
+        # In a real scenario, you'd chunk the full paper content
+        if not paper.abstract:
+            logger.debug(f"No content available for {paper.arxiv_id}, skipping")
+            skipped_count += 1
+            continue
+
+        # Chunk 1: Title + Abstract
+        chunk_text = f"Title: {paper.title}\n\nAbstract: {paper.abstract}"
+        pairs.append((paper, {"chunk_text": chunk_text, "chunk_index": 0, "section_title": "Abstract"}))
+
+    # Reuse embeddings of unchanged chunk texts from earlier runs
+    embedded = []
+    misses = []
+    for paper, chunk in pairs:
+        cached = load_cached_embedding(embed_cache, chunk["chunk_text"])
+        if cached is None:
+            misses.append((paper, chunk))
+        else:
+            embedded.append((paper, chunk, cached))
+    logger.info(f"Embedding cache: {len(embedded)} hits, {len(misses)} misses")
+
+    # Similar-length texts share a batch, so no request waits on one long outlier
+    misses.sort(key=lambda pair: len(pair[1]["chunk_text"]), reverse=True)
+    batches = [misses[i : i + EMBED_BATCH_SIZE] for i in range(0, len(misses), EMBED_BATCH_SIZE)]
+    semaphore = asyncio.Semaphore(EMBED_CONCURRENCY)
+
+    embedded_chunks = 0
+
+    async def embed_batch(batch):
+        nonlocal embedded_chunks
+        async with semaphore:
+            embeddings = await embeddings_service.embed_passages(
+                [chunk["chunk_text"] for _, chunk in batch], batch_size=EMBED_BATCH_SIZE
+            )
+        # One progress line per batch rather than per chunk
+        embedded_chunks += len(batch)
+        logger.info(f"  Embedded {embedded_chunks}/{len(misses)} chunks")
+        return embeddings
+
+    batch_results = await asyncio.gather(*(embed_batch(batch) for batch in batches), return_exceptions=True)
+
+    for batch, embeddings in zip(batches, batch_results):
+        if isinstance(embeddings, Exception):
+            logger.error(f"❌ Error generating embeddings for {len(batch)} chunks: {embeddings}")
+            error_count += len(batch)
+            continue
+
+        store_cached_embeddings(embed_cache, [chunk["chunk_text"] for _, chunk in batch], embeddings)
+        embedded.extend((paper, chunk, embedding) for (paper, chunk), embedding in zip(batch, embeddings))
+
+    # Index the embedded chunks in bulk
+    index_items = []
+    for paper, chunk, embedding in embedded:
+        # Prepare chunk data for OpenSearch
+        chunk_data = {
+            "arxiv_id": paper.arxiv_id,
+            "chunk_text": chunk["chunk_text"],
+            "chunk_index": chunk["chunk_index"],
+            "section_title": chunk.get("section_title", ""),
+            "paper_id": paper.id,
+            "title": paper.title,
+            "authors": paper.authors or [],
+            "abstract": paper.abstract,
+            "categories": paper.categories or [],
+            "published_date": paper.published_date.isoformat() if paper.published_date else None,
+        }
+        index_items.append({
+            # Keyed so a rerun overwrites this paper's abstract chunk instead of duplicating it; the
+            # suffix keeps it apart from the numbered full-text chunks of the hybrid indexer
+            "id": f"{paper.arxiv_id}-abstract",
+            "chunk_data": chunk_data,
+            "embedding": embedding,
+        })
+
+    indexed_papers = set()
+    if index_items:
+        try:
+            # The caller refreshes once when the whole load finishes
+            results = opensearch_client.bulk_index_chunks(index_items, refresh=False)
+            indexed_papers = {item["chunk_data"]["arxiv_id"] for item in index_items}
+            error_count += results["failed"]
+        except Exception as e:
+            logger.error(f"❌ Error bulk indexing chunks: {e}")
+            error_count += len(index_items)
+
+    return indexed_papers, error_count, skipped_count
+
 
 async def reindex_papers():
     """Re-index all papers from PostgreSQL to OpenSearch."""
@@ -47,99 +219,54 @@ async def reindex_papers():
 
     logger.info(f"Connecting to database...")
 
-    # Create database session
     engine = create_engine(settings.postgres_database_url)
-    SessionLocal = sessionmaker(bind=engine)
-    db = SessionLocal()
+    embed_cache = open_embed_cache(EMBED_CACHE_PATH)
 
-    try:
-        # Initialize services
-        logger.info("Initializing embeddings service...")
-        embeddings_service = make_embeddings_service()
+    # Initialize services
+    logger.info("Initializing embeddings service...")
+    embeddings_service = make_embeddings_service()
 
+    try:
         logger.info("Initializing OpenSearch client...")
         opensearch_client = make_opensearch_client()
 
-        # Get all papers from database
-        papers = db.query(Paper).all()
-        logger.info(f"Found {len(papers)} papers in database")
+        # Stream papers page by page without blocking the event loop
+        pages = iter_paper_pages(engine, PAPER_PAGE_SIZE)
+        page = await asyncio.to_thread(next, pages, None)
 
-        if not papers:
+        if not page:
             logger.warning("No papers found in database!")
             return
 
-        indexed_count = 0
+        indexed_papers = set()
         error_count = 0
+        skipped_count = 0
+        seen_count = 0
 
-        for i, paper in enumerate(papers, 1):
-            try:
-                logger.info(f"[{i}/{len(papers)}] Processing paper: {paper.arxiv_id}")
-
-                # Create chunks from abstract (since we don't have the full content)
-                # In a real scenario, you'd chunk the full paper content
-                chunks = []
-
-                # Chunk 1: Title + Abstract
-                if paper.abstract:
-                    chunk_text = f"Title: {paper.title}\n\nAbstract: {paper.abstract}"
-                    chunks.append({
-                        "chunk_text": chunk_text,
-                        "chunk_index": 0,
-                        "section_title": "Abstract"
-                    })
-
-                if not chunks:
-                    logger.warning(f"No content available for {paper.arxiv_id}, skipping")
-                    continue
-
-                # Index each chunk
-                for chunk in chunks:
-                    try:
-                        # Generate embedding
-                        logger.info(f"  Generating embedding for chunk {chunk['chunk_index']}...")
-                        embedding = await embeddings_service.embed_query(chunk["chunk_text"])
-
-                        # Prepare chunk data for OpenSearch
-                        chunk_data = {
-                            "arxiv_id": paper.arxiv_id,
-                            "chunk_text": chunk["chunk_text"],
-                            "chunk_index": chunk["chunk_index"],
-                            "section_title": chunk.get("section_title", ""),
-                            "paper_id": paper.id,
-                            "title": paper.title,
-                            "authors": paper.authors or [],
-                            "abstract": paper.abstract,
-                            "categories": paper.categories or [],
-                            "published_date": paper.published_date.isoformat() if paper.published_date else None,
-                        }
-
-                        # Index to OpenSearch
-                        success = opensearch_client.index_chunk(
-                            chunk_data=chunk_data,
-                            embedding=embedding
-                        )
-
-                        if success:
-                            logger.info(f"  ✅ Indexed chunk {chunk['chunk_index']}")
-                        else:
-                            logger.error(f"  ❌ Failed to index chunk {chunk['chunk_index']}")
-                            error_count += 1
-
-                    except Exception as e:
-                        logger.error(f"  ❌ Error indexing chunk {chunk['chunk_index']}: {e}")
-                        error_count += 1
-                        continue
-
-                indexed_count += 1
-                logger.info(f"✅ Successfully indexed paper {i}/{len(papers)}: {paper.arxiv_id}")
-
-            except Exception as e:
-                logger.error(f"❌ Error processing paper {paper.arxiv_id}: {e}")
-                error_count += 1
-                continue
+        # Refresh once when the load finishes instead of after every bulk request
+        with bulk_ingest_mode(opensearch_client.client, opensearch_client.index_name):
+            while page:
+                seen_count += len(page)
+                logger.info(f"Processing papers {seen_count - len(page) + 1}-{seen_count}...")
+
+                # Fetch the next page while this one is embedded and indexed
+                next_page = asyncio.create_task(asyncio.to_thread(next, pages, None))
+                page_indexed, page_errors, page_skipped = await index_paper_page(
+                    page, embeddings_service, opensearch_client, embed_cache
+                )
+                page = await next_page
+
+                indexed_papers |= page_indexed
+                error_count += page_errors
+                skipped_count += page_skipped
+
+        if skipped_count:
+            logger.warning(f"Skipped {skipped_count} papers with no content")
+
+        indexed_count = len(indexed_papers)
 
         logger.info(f"\n🎉 Indexing complete!")
-        logger.info(f"  ✅ Successfully indexed: {indexed_count} papers")
+        logger.info(f"  ✅ Successfully indexed: {indexed_count}/{seen_count} papers")
         logger.info(f"  ❌ Errors: {error_count}")
 
         # Verify indexing
@@ -151,17 +278,30 @@ async def reindex_papers():
             logger.error(f"Failed to check OpenSearch health: {e}")
 
     finally:
-        db.close()
+        # Release the embeddings connection pool
+        await embeddings_service.close()
+        embed_cache.close()
+        engine.dispose()
         logger.info("Database connection closed")
 
 
+def start_log_listener() -> QueueListener:
+    """Route root log records through a queue so logging never blocks the event loop on stderr writes"""
+    root = logging.getLogger()
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
+
 def main():
     logger.info("=" * 80)
     logger.info("Re-indexing papers from PostgreSQL to OpenSearch")
     logger.info("=" * 80)
 
     # Run async indexing
-    asyncio.run(reindex_papers())
+    run_with_uvloop(reindex_papers())
 
     logger.info("=" * 80)
     logger.info("Done!")
@@ -169,4 +309,9 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    log_listener = start_log_listener()
+    try:
+        main()
+    finally:
+        # Flush queued records before exiting
+        log_listener.stop()
@@ -13,12 +13,15 @@ Run: uv run python scripts/test_sec_client.py
 import asyncio
 import sys
 import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import AsyncIterator, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from src.services.sec.client import SECEdgarClient
 from src.services.sec.factory import make_sec_client
 
 # Setup logging
@@ -29,129 +32,127 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def test_company_lookup():
+@asynccontextmanager
+async def sec_client_scope(client: Optional[SECEdgarClient]) -> AsyncIterator[SECEdgarClient]:
+    """Use the client shared by main(), or open one when a test runs on its own (e.g. under pytest)."""
+    if client is not None:
+        yield client
+    else:
+        async with make_sec_client() as own_client:
+            yield own_client
+
+
+async def test_company_lookup(client: Optional[SECEdgarClient] = None):
     """Test looking up companies by ticker symbol."""
     print("\n" + "="*60)
     print("TEST 1: Company Lookup")
     print("="*60)
 
-    client = make_sec_client()
+    async with sec_client_scope(client) as client:
+        # Test with multiple companies
+        tickers = ["AAPL", "MSFT", "GOOGL", "TSLA", "NVDA"]
 
-    # Test with multiple companies
-    tickers = ["AAPL", "MSFT", "GOOGL", "TSLA", "NVDA"]
+        # Look up all tickers concurrently; the client still paces requests to the SEC rate limit
+        print(f"\n🔍 Looking up: {', '.join(tickers)}")
+        company_infos = await asyncio.gather(*(client.lookup_company(ticker) for ticker in tickers))
 
-    for ticker in tickers:
-        print(f"\n🔍 Looking up: {ticker}")
-        company_info = await client.lookup_company(ticker)
-
-        if company_info:
-            print(f"✅ Found: {company_info['company_name']}")
-            print(f"   CIK: {company_info['cik']}")
-            print(f"   Ticker: {company_info['ticker']}")
-        else:
-            print(f"❌ Not found: {ticker}")
+        for ticker, company_info in zip(tickers, company_infos):
+            if company_info:
+                print(f"✅ Found: {company_info['company_name']}")
+                print(f"   CIK: {company_info['cik']}")
+                print(f"   Ticker: {company_info['ticker']}")
+            else:
+                print(f"❌ Not found: {ticker}")
 
-    await client.close()
 
-
-async def test_10k_filings():
+async def test_10k_filings(client: Optional[SECEdgarClient] = None):
     """Test fetching 10-K annual reports."""
     print("\n" + "="*60)
     print("TEST 2: Fetch 10-K Annual Reports")
     print("="*60)
 
-    client = make_sec_client()
-
-    ticker = "AAPL"
-    count = 3
+    async with sec_client_scope(client) as client:
+        ticker = "AAPL"
+        count = 3
 
-    print(f"\n📊 Fetching last {count} 10-K filings for {ticker}...")
+        print(f"\n📊 Fetching last {count} 10-K filings for {ticker}...")
 
-    filings = await client.fetch_10k_filings(ticker, count=count)
+        filings = await client.fetch_10k_filings(ticker, count=count)
 
-    if filings:
-        print(f"✅ Found {len(filings)} filings:\n")
-
-        for i, filing in enumerate(filings, 1):
-            print(f"{i}. {filing['document_type']} - Filed: {filing['filing_date'].strftime('%Y-%m-%d')}")
-            print(f"   Company: {filing['company_name']}")
-            print(f"   Fiscal Year: {filing['fiscal_year']}")
-            print(f"   Accession #: {filing['accession_number']}")
-            print(f"   URL: {filing['filing_url'][:80]}...")
-            print()
-    else:
-        print(f"❌ No filings found for {ticker}")
+        if filings:
+            print(f"✅ Found {len(filings)} filings:\n")
 
-    await client.close()
+            for i, filing in enumerate(filings, 1):
+                print(f"{i}. {filing['document_type']} - Filed: {filing['filing_date'].strftime('%Y-%m-%d')}")
+                print(f"   Company: {filing['company_name']}")
+                print(f"   Fiscal Year: {filing['fiscal_year']}")
+                print(f"   Accession #: {filing['accession_number']}")
+                print(f"   URL: {filing['filing_url'][:80]}...")
+                print()
+        else:
+            print(f"❌ No filings found for {ticker}")
 
 
-async def test_10q_filings():
+async def test_10q_filings(client: Optional[SECEdgarClient] = None):
     """Test fetching 10-Q quarterly reports."""
     print("\n" + "="*60)
     print("TEST 3: Fetch 10-Q Quarterly Reports")
     print("="*60)
 
-    client = make_sec_client()
-
-    ticker = "MSFT"
-    count = 2
+    async with sec_client_scope(client) as client:
+        ticker = "MSFT"
+        count = 2
 
-    print(f"\n📊 Fetching last {count} 10-Q filings for {ticker}...")
+        print(f"\n📊 Fetching last {count} 10-Q filings for {ticker}...")
 
-    filings = await client.fetch_10q_filings(ticker, count=count)
+        filings = await client.fetch_10q_filings(ticker, count=count)
 
-    if filings:
-        print(f"✅ Found {len(filings)} filings:\n")
+        if filings:
+            print(f"✅ Found {len(filings)} filings:\n")
 
-        for i, filing in enumerate(filings, 1):
-            print(f"{i}. {filing['document_type']} - Filed: {filing['filing_date'].strftime('%Y-%m-%d')}")
-            print(f"   Company: {filing['company_name']}")
-            print(f"   URL: {filing['filing_url'][:80]}...")
-            print()
-    else:
-        print(f"❌ No filings found for {ticker}")
-
-    await client.close()
+            for i, filing in enumerate(filings, 1):
+                print(f"{i}. {filing['document_type']} - Filed: {filing['filing_date'].strftime('%Y-%m-%d')}")
+                print(f"   Company: {filing['company_name']}")
+                print(f"   URL: {filing['filing_url'][:80]}...")
+                print()
+        else:
+            print(f"❌ No filings found for {ticker}")
 
 
-async def test_download_content():
+async def test_download_content(client: Optional[SECEdgarClient] = None):
     """Test downloading filing content."""
     print("\n" + "="*60)
     print("TEST 4: Download Filing Content")
     print("="*60)
 
-    client = make_sec_client()
+    async with sec_client_scope(client) as client:
+        # Get Apple's latest 10-K
+        print("\n📥 Fetching Apple's latest 10-K to download...")
+        filings = await client.fetch_10k_filings("AAPL", count=1)
 
-    # Get Apple's latest 10-K
-    print("\n📥 Fetching Apple's latest 10-K to download...")
-    filings = await client.fetch_10k_filings("AAPL", count=1)
+        if not filings:
+            print("❌ Could not fetch filing")
+            return
 
-    if not filings:
-        print("❌ Could not fetch filing")
-        await client.close()
-        return
+        filing = filings[0]
+        print(f"✅ Got filing: {filing['document_type']} from {filing['filing_date'].strftime('%Y-%m-%d')}")
+        print(f"   URL: {filing['filing_url']}")
 
-    filing = filings[0]
-    print(f"✅ Got filing: {filing['document_type']} from {filing['filing_date'].strftime('%Y-%m-%d')}")
-    print(f"   URL: {filing['filing_url']}")
+        print("\n📥 Downloading content... (this may take a few seconds)")
+        content = await client.download_filing_content(filing["filing_url"])
 
-    print("\n📥 Downloading content... (this may take a few seconds)")
-    content = await client.download_filing_content(filing["filing_url"])
+        if content:
+            print(f"✅ Downloaded successfully!")
+            print(f"   Content length: {len(content):,} characters")
+            print(f"   Lines: {len(content.splitlines()):,}")
 
-    if content:
-        print(f"✅ Downloaded successfully!")
-        print(f"   Content length: {len(content):,} characters")
-        print(f"   Lines: {len(content.splitlines()):,}")
-
-        # Show first 500 characters as preview
-        print("\n📄 Content preview (first 500 chars):")
-        print("-" * 60)
-        print(content[:500])
-        print("-" * 60)
-    else:
-        print("❌ Download failed")
-
-    await client.close()
+            # Show first 500 characters as preview
+            print("\n📄 Content preview (first 500 chars):")
+            print("-" * 60)
+            print(content[:500])
+            print("-" * 60)
+        else:
+            print("❌ Download failed")
 
 
 async def main():
@@ -164,11 +165,12 @@ async def main():
     print()
 
     try:
-        # Run all tests
-        await test_company_lookup()
-        await test_10k_filings()
-        await test_10q_filings()
-        await test_download_content()
+        # Run all tests on one client so they share its keep-alive connections
+        async with make_sec_client() as client:
+            await test_company_lookup(client)
+            await test_10k_filings(client)
+            await test_10q_filings(client)
+            await test_download_content(client)
 
         print("\n" + "="*60)
         print("✅ ALL TESTS COMPLETED!")
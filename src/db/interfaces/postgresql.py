@@ -37,6 +37,11 @@ class PostgreSQLDatabase(BaseDatabase):
                 pool_size=self.config.pool_size,
                 max_overflow=self.config.max_overflow,
                 pool_pre_ping=True,  # Verify connections before use
+                # executemany INSERTs become multi-row VALUES statements; UPDATE/DELETE executemany
+                # (e.g. bulk mark-as-indexed) are sent through psycopg2's execute_batch
+                executemany_mode="values_plus_batch",
+                insertmanyvalues_page_size=1000,
+                executemany_batch_page_size=500,
             )
 
             self.session_factory = sessionmaker(bind=self.engine, expire_on_commit=False)
@@ -110,6 +110,7 @@ async def lifespan(app: FastAPI):
     yield
 
     # Cleanup
+    await app.state.arxiv_client.aclose()
     database.teardown()
     logger.info("API shutdown complete")
 
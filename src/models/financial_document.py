@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import JSON, Boolean, Column, DateTime, String, Text, Integer
+from sqlalchemy import DDL, JSON, Boolean, Column, DateTime, Index, String, Text, Integer, event, text
 from sqlalchemy.dialects.postgresql import UUID
 from src.db.interfaces.postgresql import Base
 
@@ -19,11 +19,11 @@ class FinancialDocument(Base):
 
     # Company identification
     cik = Column(String, index=True, nullable=True)  # SEC Central Index Key (e.g., "0000320193" for Apple)
-    ticker_symbol = Column(String, index=True, nullable=False)  # Stock ticker (e.g., "AAPL")
+    ticker_symbol = Column(String, nullable=False)  # Stock ticker (e.g., "AAPL"); indexed by ix_fd_ticker_date
     company_name = Column(String, nullable=False)  # Full company name
 
     # Document metadata
-    document_type = Column(String, nullable=False, index=True)  # "10-K", "10-Q", "8-K", "earnings", "proxy"
+    document_type = Column(String, nullable=False)  # "10-K", "10-Q", "8-K", "earnings", "proxy"; indexed by ix_fd_type_date
     fiscal_year = Column(String, nullable=True)  # e.g., "2024"
     fiscal_period = Column(String, nullable=True)  # "Q1", "Q2", "Q3", "Q4", "FY"
     filing_date = Column(DateTime, nullable=False, index=True)  # When the document was filed
@@ -53,6 +53,20 @@ class FinancialDocument(Base):
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
 
+    __table_args__ = (
+        # Indexing queue (get_unindexed_documents): only rows still waiting, already in parsing_date order
+        Index(
+            "ix_fd_unindexed_queue",
+            parsing_date.desc(),
+            postgresql_where=text("content_parsed AND NOT indexed_in_opensearch"),
+        ),
+        # Per-company and per-type listings, newest filing first; id breaks ties for keyset pagination.
+        # Their leading columns also serve plain ticker_symbol / document_type lookups
+        Index("ix_fd_date_id", filing_date.desc(), id.desc()),
+        Index("ix_fd_ticker_date", ticker_symbol, filing_date.desc(), id.desc()),
+        Index("ix_fd_type_date", document_type, filing_date.desc()),
+    )
+
     def __repr__(self):
         return f"<FinancialDocument(ticker={self.ticker_symbol}, type={self.document_type}, date={self.filing_date})>"
 
@@ -76,3 +90,13 @@ class FinancialDocument(Base):
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "updated_at": self.updated_at.isoformat() if self.updated_at else None,
         }
+
+
+# Filing bodies are TOASTed; lz4 (PostgreSQL 14+) decompresses several times faster than the default pglz
+event.listen(
+    FinancialDocument.__table__,
+    "after_create",
+    DDL(
+        "ALTER TABLE %(table)s ALTER COLUMN full_text SET COMPRESSION lz4, ALTER COLUMN sections SET COMPRESSION lz4"
+    ).execute_if(dialect="postgresql"),
+)
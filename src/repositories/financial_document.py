@@ -1,26 +1,85 @@
-from datetime import datetime
-from typing import List, Optional
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Set
 from uuid import UUID
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, defer
 from src.models.financial_document import FinancialDocument
 
+# Listing queries only need metadata; the document body loads on first access (or via get_by_id)
+DEFER_DOCUMENT_BODY = (
+    defer(FinancialDocument.full_text),
+    defer(FinancialDocument.sections),
+    defer(FinancialDocument.parser_metadata),
+)
+
 
 class FinancialDocumentRepository:
     """Repository for financial document database operations"""
 
     def __init__(self, session: Session):
         self.session = session
+        self._batch_depth = 0
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group writes into one transaction: commits inside the block become flushes, with one commit on exit.
+
+        Batches may nest; only the outermost one commits, or rolls back if the block raises.
+        The nesting depth is per repository, so do not enter batches from concurrent coroutines.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        except Exception:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.session.rollback()
+            raise
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.session.commit()
+
+    def end_read(self) -> None:
+        """End the transaction earlier reads opened, returning its connection to the pool (no-op inside batch())"""
+        if not self._batch_depth:
+            self.session.commit()
+
+    def _commit(self) -> None:
+        """Commit, or only flush while inside batch() so the outermost batch commits once"""
+        if self._batch_depth:
+            self.session.flush()
+        else:
+            self.session.commit()
 
     def create(self, document_data: dict) -> FinancialDocument:
         """Create a new financial document"""
         db_document = FinancialDocument(**document_data)
         self.session.add(db_document)
-        self.session.commit()
+        self._commit()
         self.session.refresh(db_document)
         return db_document
 
+    def bulk_create(self, documents: List[dict]) -> List[UUID]:
+        """Create many financial documents with one commit, returning their ids in input order.
+
+        Rows are sent as multi-row INSERT statements (up to 1000 rows each) rather than one INSERT per row.
+        """
+        if not documents:
+            return []
+
+        stmt = pg_insert(FinancialDocument).returning(FinancialDocument.id, sort_by_parameter_order=True)
+        if self._batch_depth:
+            # A failed insert rolls back to its savepoint without losing the rest of the batch
+            with self.session.begin_nested():
+                return list(self.session.scalars(stmt, documents))
+
+        document_ids = list(self.session.scalars(stmt, documents))
+        self.session.commit()
+        return document_ids
+
     def get_by_id(self, document_id: UUID) -> Optional[FinancialDocument]:
         """Get document by UUID"""
         stmt = select(FinancialDocument).where(FinancialDocument.id == document_id)
@@ -31,10 +90,20 @@ class FinancialDocumentRepository:
         stmt = select(FinancialDocument).where(FinancialDocument.accession_number == accession_number)
         return self.session.scalar(stmt)
 
+    def get_existing_accession_numbers(self, accession_numbers: List[str]) -> Set[str]:
+        """Return which of the given accession numbers are already stored, in one query"""
+        if not accession_numbers:
+            return set()
+        stmt = select(FinancialDocument.accession_number).where(
+            FinancialDocument.accession_number.in_(accession_numbers)
+        )
+        return set(self.session.scalars(stmt))
+
     def get_by_ticker(self, ticker: str, limit: int = 100, offset: int = 0) -> List[FinancialDocument]:
         """Get all documents for a specific company ticker"""
         stmt = (
             select(FinancialDocument)
+            .options(*DEFER_DOCUMENT_BODY)
             .where(FinancialDocument.ticker_symbol == ticker.upper())
             .order_by(FinancialDocument.filing_date.desc())
             .limit(limit)
@@ -42,6 +111,25 @@ class FinancialDocumentRepository:
         )
         return list(self.session.scalars(stmt))
 
+    def get_by_ticker_after(
+        self,
+        ticker: str,
+        last_filing_date: Optional[datetime] = None,
+        last_id: Optional[UUID] = None,
+        limit: int = 100,
+    ) -> List[FinancialDocument]:
+        """Get the next page of a company's documents after (last_filing_date, last_id), newest first.
+
+        Keyset pagination: pass the filing_date and id of the last row of the previous page,
+        or neither for the first page. Each page is an index range scan regardless of depth.
+        """
+        stmt = (
+            select(FinancialDocument)
+            .options(*DEFER_DOCUMENT_BODY)
+            .where(FinancialDocument.ticker_symbol == ticker.upper())
+        )
+        return self._keyset_page(stmt, last_filing_date, last_id, limit)
+
     def get_by_document_type(
         self,
         document_type: str,
@@ -51,6 +139,7 @@ class FinancialDocumentRepository:
         """Get documents by type (10-K, 10-Q, etc.)"""
         stmt = (
             select(FinancialDocument)
+            .options(*DEFER_DOCUMENT_BODY)
             .where(FinancialDocument.document_type == document_type)
             .order_by(FinancialDocument.filing_date.desc())
             .limit(limit)
@@ -62,12 +151,37 @@ class FinancialDocumentRepository:
         """Get all financial documents"""
         stmt = (
             select(FinancialDocument)
+            .options(*DEFER_DOCUMENT_BODY)
             .order_by(FinancialDocument.filing_date.desc())
             .limit(limit)
             .offset(offset)
         )
         return list(self.session.scalars(stmt))
 
+    def get_all_after(
+        self,
+        last_filing_date: Optional[datetime] = None,
+        last_id: Optional[UUID] = None,
+        limit: int = 100,
+    ) -> List[FinancialDocument]:
+        """Get the next page of all documents after (last_filing_date, last_id), newest first.
+
+        Keyset counterpart of get_all; prefer it for walking the whole table.
+        """
+        stmt = select(FinancialDocument).options(*DEFER_DOCUMENT_BODY)
+        return self._keyset_page(stmt, last_filing_date, last_id, limit)
+
+    def _keyset_page(
+        self, stmt, last_filing_date: Optional[datetime], last_id: Optional[UUID], limit: int
+    ) -> List[FinancialDocument]:
+        """Order by (filing_date, id) descending and seek past the given key instead of using OFFSET"""
+        if last_filing_date is not None and last_id is not None:
+            stmt = stmt.where(
+                tuple_(FinancialDocument.filing_date, FinancialDocument.id) < tuple_(last_filing_date, last_id)
+            )
+        stmt = stmt.order_by(FinancialDocument.filing_date.desc(), FinancialDocument.id.desc()).limit(limit)
+        return list(self.session.scalars(stmt))
+
     def get_count(self) -> int:
         """Get total count of documents"""
         stmt = select(func.count(FinancialDocument.id))
@@ -95,6 +209,20 @@ class FinancialDocumentRepository:
         )
         return list(self.session.scalars(stmt))
 
+    def iter_unparsed_documents(self, page_size: int = 200) -> Iterator[List[FinancialDocument]]:
+        """Stream documents that haven't been parsed yet in pages over a server-side cursor.
+
+        Unlike get_unparsed_documents there is no limit, and only one page is held in memory at a time.
+        The cursor lives inside the current transaction, so commit only after iteration ends.
+        """
+        stmt = (
+            select(FinancialDocument)
+            .where(FinancialDocument.content_parsed == False)
+            .order_by(FinancialDocument.filing_date.desc())
+            .execution_options(yield_per=page_size)
+        )
+        yield from self.session.scalars(stmt).partitions()
+
     def get_indexed_documents(self, limit: int = 100, offset: int = 0) -> List[FinancialDocument]:
         """Get documents indexed in OpenSearch"""
         stmt = (
@@ -120,32 +248,48 @@ class FinancialDocumentRepository:
         )
         return list(self.session.scalars(stmt))
 
-    def get_stats(self) -> dict:
-        """Get statistics about financial documents"""
-        total_docs = self.get_count()
-
-        # Count parsed documents
-        parsed_stmt = select(func.count(FinancialDocument.id)).where(
-            FinancialDocument.content_parsed == True
-        )
-        parsed_docs = self.session.scalar(parsed_stmt) or 0
+    def iter_unindexed_documents(self, page_size: int = 50) -> Iterator[List[FinancialDocument]]:
+        """Stream parsed, unindexed documents in pages over a server-side cursor.
 
-        # Count indexed documents
-        indexed_stmt = select(func.count(FinancialDocument.id)).where(
-            FinancialDocument.indexed_in_opensearch == True
+        Only one page of documents (and their full_text) is held in memory at a time.
+        The cursor lives inside the current transaction, so commit only after iteration ends.
+        """
+        stmt = (
+            select(FinancialDocument)
+            .where(
+                FinancialDocument.content_parsed == True,
+                FinancialDocument.indexed_in_opensearch == False
+            )
+            .order_by(FinancialDocument.parsing_date.desc())
+            .execution_options(yield_per=page_size)
         )
-        indexed_docs = self.session.scalar(indexed_stmt) or 0
+        yield from self.session.scalars(stmt).partitions()
 
-        # Count unique companies
-        companies_stmt = select(func.count(func.distinct(FinancialDocument.ticker_symbol)))
-        unique_companies = self.session.scalar(companies_stmt) or 0
-
-        # Count by document type
-        doc_types_stmt = select(
+    def get_stats(self) -> dict:
+        """Get statistics about financial documents"""
+        # One round-trip: GROUPING SETS returns a row per document type plus a grand-total row
+        # (grouping() == 1), which Postgres emits even for an empty table
+        stmt = select(
+            func.grouping(FinancialDocument.document_type).label("is_total"),
             FinancialDocument.document_type,
-            func.count(FinancialDocument.id)
-        ).group_by(FinancialDocument.document_type)
-        doc_types = dict(self.session.execute(doc_types_stmt).all())
+            func.count().label("documents"),
+            func.count().filter(FinancialDocument.content_parsed == True).label("parsed"),
+            func.count().filter(FinancialDocument.indexed_in_opensearch == True).label("indexed"),
+            func.count(func.distinct(FinancialDocument.ticker_symbol)).label("companies"),
+        ).group_by(func.grouping_sets(FinancialDocument.document_type, tuple_()))
+
+        total_docs = parsed_docs = indexed_docs = unique_companies = 0
+        doc_types = {}
+        for row in self.session.execute(stmt):
+            if row.is_total:
+                total_docs, parsed_docs, indexed_docs, unique_companies = (
+                    row.documents,
+                    row.parsed,
+                    row.indexed,
+                    row.companies,
+                )
+            else:
+                doc_types[row.document_type] = row.documents
 
         return {
             "total_documents": total_docs,
@@ -160,25 +304,44 @@ class FinancialDocumentRepository:
     def update(self, document: FinancialDocument) -> FinancialDocument:
         """Update an existing document"""
         self.session.add(document)
-        self.session.commit()
+        self._commit()
         self.session.refresh(document)
         return document
 
     def upsert(self, document_data: dict) -> FinancialDocument:
-        """Insert or update a document based on accession number"""
-        accession_number = document_data.get("accession_number")
+        """Insert or update a document based on accession number, in a single INSERT ... ON CONFLICT statement"""
+        if not document_data.get("accession_number"):
+            # Without an accession number there is nothing to conflict on
+            return self.create(document_data)
 
-        if accession_number:
-            existing_doc = self.get_by_accession_number(accession_number)
-            if existing_doc:
-                # Update existing document
-                for key, value in document_data.items():
-                    if hasattr(existing_doc, key):
-                        setattr(existing_doc, key, value)
-                return self.update(existing_doc)
+        stmt = self._upsert_statement(document_data.keys()).values(document_data).returning(FinancialDocument)
+        document = self.session.scalar(stmt, execution_options={"populate_existing": True})
+        self._commit()
+        return document
 
-        # Create new document
-        return self.create(document_data)
+    def bulk_upsert(self, documents: List[dict]) -> List[UUID]:
+        """Insert or update many documents by accession number with one commit, returning their ids in input order.
+
+        All documents must have the same keys, including accession_number.
+        """
+        if not documents:
+            return []
+
+        stmt = self._upsert_statement(documents[0].keys()).returning(FinancialDocument.id, sort_by_parameter_order=True)
+        document_ids = list(self.session.scalars(stmt, documents))
+        self._commit()
+        return document_ids
+
+    @staticmethod
+    def _upsert_statement(keys):
+        """INSERT ... ON CONFLICT (accession_number) DO UPDATE of the given columns only, like a partial update"""
+        stmt = pg_insert(FinancialDocument)
+        update_columns = {
+            key: stmt.excluded[key] for key in keys if key not in ("id", "created_at", "accession_number")
+        }
+        # onupdate defaults are not applied to ON CONFLICT DO UPDATE
+        update_columns["updated_at"] = datetime.now(timezone.utc)
+        return stmt.on_conflict_do_update(index_elements=[FinancialDocument.accession_number], set_=update_columns)
 
     def mark_as_parsed(self, document_id: UUID) -> FinancialDocument:
         """Mark a document as successfully parsed"""
@@ -198,3 +361,24 @@ class FinancialDocumentRepository:
             document.chunk_count = chunk_count
             return self.update(document)
         return None
+
+    def mark_many_as_indexed(self, chunk_counts: Dict[UUID, int]) -> int:
+        """Mark documents as indexed in OpenSearch in one batched UPDATE and a single commit"""
+        if not chunk_counts:
+            return 0
+
+        indexing_date = datetime.now()
+        self.session.execute(
+            update(FinancialDocument),
+            [
+                {
+                    "id": document_id,
+                    "indexed_in_opensearch": True,
+                    "indexing_date": indexing_date,
+                    "chunk_count": chunk_count,
+                }
+                for document_id, chunk_count in chunk_counts.items()
+            ],
+        )
+        self._commit()
+        return len(chunk_counts)
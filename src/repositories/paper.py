@@ -1,8 +1,9 @@
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Dict, FrozenSet, List, Optional
 from uuid import UUID
 
 from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 from src.models.paper import Paper
 from src.schemas.arxiv.paper import PaperCreate
@@ -93,3 +94,26 @@ class PaperRepository:
         else:
             # Create new paper
             return self.create(paper_create)
+
+    def bulk_upsert(self, papers: List[PaperCreate]) -> int:
+        """Insert or update many papers with INSERT ... ON CONFLICT (arxiv_id) DO UPDATE.
+
+        Rows are grouped by the fields that were explicitly set, so each group is a single
+        multi-row statement and unset fields keep their stored values, as in upsert().
+        The caller owns the transaction (no commit here).
+        """
+        # Last occurrence wins; ON CONFLICT cannot touch the same row twice in one statement
+        unique_papers = {paper.arxiv_id: paper for paper in papers}
+
+        groups: Dict[FrozenSet[str], List[dict]] = {}
+        for paper in unique_papers.values():
+            row = paper.model_dump(exclude_unset=True)
+            groups.setdefault(frozenset(row), []).append(row)
+
+        for columns, rows in groups.items():
+            stmt = insert(Paper).values(rows)
+            update_columns = {column: stmt.excluded[column] for column in columns if column != "arxiv_id"}
+            update_columns["updated_at"] = datetime.now(timezone.utc)
+            self.session.execute(stmt.on_conflict_do_update(index_elements=[Paper.arxiv_id], set_=update_columns))
+
+        return len(unique_papers)
@@ -1,4 +1,9 @@
+import asyncio
+import time
+from typing import Dict, Optional, Tuple
+
 from fastapi import APIRouter
+from pydantic import BaseModel
 from sqlalchemy import text
 
 from ..dependencies import DatabaseDep, OpenSearchDep, FinancialOpenSearchDep, SettingsDep
@@ -7,31 +12,41 @@ from ..services.ollama import OllamaClient
 
 router = APIRouter()
 
+# Dashboards and load balancers poll these endpoints; within the TTL they get the last result
+# instead of every poll hitting PostgreSQL, OpenSearch and Ollama
+HEALTH_CACHE_TTL_SECONDS = 3.0
+STATS_CACHE_TTL_SECONDS = 5.0
+
+_response_cache: Dict[str, Tuple[float, BaseModel]] = {}
+
+
+def _get_cached(key: str, ttl_seconds: float) -> Optional[BaseModel]:
+    """Return the cached response for key if it is younger than ttl_seconds."""
+    entry = _response_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < ttl_seconds:
+        return entry[1]
+    return None
+
+
+def _set_cached(key: str, response: BaseModel) -> None:
+    _response_cache[key] = (time.monotonic(), response)
+
 
 @router.get("/health", response_model=HealthResponse, tags=["Health"])
-async def health_check(settings: SettingsDep, database: DatabaseDep, opensearch_client: OpenSearchDep) -> HealthResponse:
+async def health_check(
+    settings: SettingsDep, database: DatabaseDep, opensearch_client: OpenSearchDep, fresh: bool = False
+) -> HealthResponse:
     """Comprehensive health check endpoint for monitoring and load balancer probes.
 
+    Results are cached for a few seconds; pass ``fresh=true`` to bypass the cache.
+
     :returns: Service health status with version and connectivity checks
     :rtype: HealthResponse
     """
-    services = {}
-    overall_status = "ok"
-
-    def _check_service(name: str, check_func, *args, **kwargs):
-        """Helper to standardize service health checks."""
-        try:
-            if kwargs.get("is_async"):
-                # Handle async functions separately in the calling code
-                return check_func(*args)
-            result = check_func(*args)
-            services[name] = result
-            if result.status != "healthy":
-                nonlocal overall_status
-                overall_status = "degraded"
-        except Exception as e:
-            services[name] = ServiceStatus(status="unhealthy", message=str(e))
-            overall_status = "degraded"
+    if not fresh:
+        cached = _get_cached("health", HEALTH_CACHE_TTL_SECONDS)
+        if cached is not None:
+            return cached
 
     # Database check
     def _check_database():
@@ -49,39 +64,57 @@ async def health_check(settings: SettingsDep, database: DatabaseDep, opensearch_
             message=f"Index '{stats.get('index_name', 'unknown')}' with {stats.get('document_count', 0)} documents",
         )
 
-    # Run synchronous checks
-    _check_service("database", _check_database)
-    _check_service("opensearch", _check_opensearch)
+    # Ollama check
+    async def _check_ollama():
+        ollama_health = await OllamaClient(settings).health_check()
+        return ServiceStatus(status=ollama_health["status"], message=ollama_health["message"])
+
+    # Run all checks concurrently, so the probe takes as long as the slowest check rather than their sum;
+    # the blocking database and OpenSearch clients run on worker threads
+    names = ("database", "opensearch", "ollama")
+    results = await asyncio.gather(
+        asyncio.to_thread(_check_database),
+        asyncio.to_thread(_check_opensearch),
+        _check_ollama(),
+        return_exceptions=True,
+    )
 
-    # Handle Ollama async check separately
-    try:
-        ollama_client = OllamaClient(settings)
-        ollama_health = await ollama_client.health_check()
-        services["ollama"] = ServiceStatus(status=ollama_health["status"], message=ollama_health["message"])
-        if ollama_health["status"] != "healthy":
+    services = {}
+    overall_status = "ok"
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            result = ServiceStatus(status="unhealthy", message=str(result))
+        services[name] = result
+        if result.status != "healthy":
             overall_status = "degraded"
-    except Exception as e:
-        services["ollama"] = ServiceStatus(status="unhealthy", message=str(e))
-        overall_status = "degraded"
 
-    return HealthResponse(
+    response = HealthResponse(
         status=overall_status,
         version=settings.app_version,
         environment=settings.environment,
         service_name=settings.service_name,
         services=services,
     )
+    _set_cached("health", response)
+    return response
 
 
 @router.get("/stats", response_model=StatsResponse, tags=["Health"])
 async def get_stats(
     opensearch_client: OpenSearchDep,
-    financial_opensearch_client: FinancialOpenSearchDep
+    financial_opensearch_client: FinancialOpenSearchDep,
+    fresh: bool = False,
 ) -> StatsResponse:
     """Get document statistics for all indexes.
 
-    Returns counts for arXiv papers and financial documents.
+    Returns counts for arXiv papers and financial documents, cached for a few seconds
+    unless ``fresh=true``.
     """
+    if not fresh:
+        cached = _get_cached("stats", STATS_CACHE_TTL_SECONDS)
+        if cached is not None:
+            return cached
+
     # Get arXiv stats
     arxiv_stats = opensearch_client.get_index_stats()
     arxiv = IndexStats(
@@ -98,8 +131,10 @@ async def get_stats(
         size_mb=financial_stats.get("size_mb")
     )
 
-    return StatsResponse(
+    response = StatsResponse(
         arxiv=arxiv,
         financial=financial,
         total_documents=arxiv.documents + financial.documents
     )
+    _set_cached("stats", response)
+    return response
@@ -1,4 +1,5 @@
 import asyncio
+import importlib.util
 import logging
 import time
 import xml.etree.ElementTree as ET
@@ -14,6 +15,13 @@ from src.schemas.arxiv.paper import ArxivPaper
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the optional h2 package; without it httpx stays on HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Connection pool for PDF downloads, shared by every download made through one client
+PDF_MAX_CONNECTIONS = 64
+PDF_MAX_KEEPALIVE_CONNECTIONS = 32
+
 
 class ArxivClient:
     """Client for fetching papers from arXiv API."""
@@ -21,6 +29,7 @@ class ArxivClient:
     def __init__(self, settings: ArxivSettings):
         self._settings = settings
         self._last_request_time: Optional[float] = None
+        self._pdf_http_client: Optional[httpx.AsyncClient] = None
 
     @cached_property
     def pdf_cache_dir(self) -> Path:
@@ -29,6 +38,26 @@ class ArxivClient:
         cache_dir.mkdir(parents=True, exist_ok=True)
         return cache_dir
 
+    @property
+    def pdf_http_client(self) -> httpx.AsyncClient:
+        """HTTP client for PDF downloads, created on first use so its pool is bound to the running loop."""
+        if self._pdf_http_client is None or self._pdf_http_client.is_closed:
+            self._pdf_http_client = httpx.AsyncClient(
+                timeout=float(self.timeout_seconds),
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=PDF_MAX_CONNECTIONS,
+                    max_keepalive_connections=PDF_MAX_KEEPALIVE_CONNECTIONS,
+                ),
+            )
+        return self._pdf_http_client
+
+    async def aclose(self) -> None:
+        """Close the PDF download connection pool."""
+        if self._pdf_http_client is not None:
+            await self._pdf_http_client.aclose()
+            self._pdf_http_client = None
+
     @property
     def base_url(self) -> str:
         return self._settings.base_url
@@ -455,12 +484,12 @@ class ArxivClient:
 
         for attempt in range(max_retries):
             try:
-                async with httpx.AsyncClient(timeout=float(self.timeout_seconds)) as client:
-                    async with client.stream("GET", url) as response:
-                        response.raise_for_status()
-                        with open(path, "wb") as f:
-                            async for chunk in response.aiter_bytes():
-                                f.write(chunk)
+                # Shared pool: downloads after the first reuse the open connection to arxiv.org
+                async with self.pdf_http_client.stream("GET", url) as response:
+                    response.raise_for_status()
+                    with open(path, "wb") as f:
+                        async for chunk in response.aiter_bytes():
+                            f.write(chunk)
                 logger.info(f"Successfully downloaded to {path.name}")
                 return True
 
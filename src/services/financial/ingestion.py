@@ -14,6 +14,7 @@ Example:
     await service.ingest_company("AAPL", filing_types=["10-K"], count=1)
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import List, Optional, Dict, Any
@@ -25,6 +26,9 @@ from src.repositories.financial_document import FinancialDocumentRepository
 
 logger = logging.getLogger(__name__)
 
+# Filing downloads in flight at once; the SEC client still paces requests to its rate limit
+DOWNLOAD_CONCURRENCY = 10
+
 
 class FinancialDocumentIngestionService:
     """
@@ -50,6 +54,9 @@ class FinancialDocumentIngestionService:
         self.sec_client = sec_client
         self.repository = FinancialDocumentRepository(db_session)
 
+        # Shared by every company and filing type, so bulk ingests stay within one download budget
+        self._download_semaphore = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+
         logger.info("Financial document ingestion service initialized")
 
     async def ingest_company(
@@ -101,9 +108,10 @@ class FinancialDocumentIngestionService:
         }
 
         try:
-            # Process each filing type
+            # Download every filing type first, so no transaction is held open across SEC requests
+            pending = []
             for filing_type in filing_types:
-                filing_result = await self._ingest_filing_type(
+                filing_result = await self._fetch_filing_type(
                     ticker,
                     filing_type,
                     count
@@ -113,10 +121,14 @@ class FinancialDocumentIngestionService:
                 if not result["company_name"] and filing_result.get("company_name"):
                     result["company_name"] = filing_result["company_name"]
 
-                result["filings_processed"] += filing_result["filings_processed"]
                 result["filings_skipped"] += filing_result["filings_skipped"]
                 result["filings_failed"] += filing_result["filings_failed"]
-                result["documents"].extend(filing_result["documents"])
+                pending.append((filing_type, filing_result["new_documents"]))
+
+            # Then save every filing type in one short transaction
+            with self.repository.batch():
+                for filing_type, new_documents in pending:
+                    self._store_filings(ticker, filing_type, new_documents, result)
 
             logger.info(
                 f"Completed ingestion for {ticker}: "
@@ -132,14 +144,14 @@ class FinancialDocumentIngestionService:
             result["error"] = str(e)
             return result
 
-    async def _ingest_filing_type(
+    async def _fetch_filing_type(
         self,
         ticker: str,
         filing_type: str,
         count: int
     ) -> Dict[str, Any]:
         """
-        Ingest filings of a specific type for a company.
+        Fetch and download filings of a specific type for a company, without saving them.
 
         Internal method called by ingest_company().
 
@@ -149,16 +161,15 @@ class FinancialDocumentIngestionService:
             count: Number of filings to fetch
 
         Returns:
-            Dict with processing results
+            Dict with processing results and new_documents, the records to insert
         """
         logger.info(f"Fetching {filing_type} filings for {ticker} (count: {count})")
 
         result = {
             "company_name": None,
-            "filings_processed": 0,
             "filings_skipped": 0,
             "filings_failed": 0,
-            "documents": []
+            "new_documents": []
         }
 
         try:
@@ -176,16 +187,30 @@ class FinancialDocumentIngestionService:
                 return result
 
             result["company_name"] = filings[0]["company_name"]
+            filings = filings[:count]  # Limit to requested count
 
-            # Step 2: Process each filing
-            for filing in filings[:count]:  # Limit to requested count
-                filing_result = await self._process_filing(filing)
+            # Step 2: Skip filings already stored (one query), then release the connection before downloading
+            existing = self.repository.get_existing_accession_numbers(
+                [filing["accession_number"] for filing in filings]
+            )
+            self.repository.end_read()
+            for filing in filings:
+                if filing["accession_number"] in existing:
+                    logger.info(f"Filing already exists: {filing['accession_number']} - skipping")
+            result["filings_skipped"] += len(existing)
+
+            # Step 3: Download new filings concurrently, buffering their records for one batched insert
+            filing_results = await asyncio.gather(
+                *(
+                    self._process_filing_limited(filing)
+                    for filing in filings
+                    if filing["accession_number"] not in existing
+                )
+            )
 
-                if filing_result["status"] == "processed":
-                    result["filings_processed"] += 1
-                    result["documents"].append(filing_result["document_id"])
-                elif filing_result["status"] == "skipped":
-                    result["filings_skipped"] += 1
+            for filing_result in filing_results:
+                if filing_result["status"] == "ready":
+                    result["new_documents"].append(filing_result["document_data"])
                 elif filing_result["status"] == "failed":
                     result["filings_failed"] += 1
 
@@ -196,18 +221,52 @@ class FinancialDocumentIngestionService:
             result["error"] = str(e)
             return result
 
+    def _store_filings(
+        self,
+        ticker: str,
+        filing_type: str,
+        new_documents: List[Dict[str, Any]],
+        result: Dict[str, Any]
+    ) -> None:
+        """
+        Save downloaded filings of one type, recording the outcome in the company's result.
+
+        A failed insert only fails this filing type's documents; inside a batch the others still commit.
+        """
+        try:
+            document_ids = self.repository.bulk_create(new_documents)
+        except Exception as e:
+            logger.error(f"Error storing {len(new_documents)} {filing_type} filings for {ticker}: {e}")
+            result["filings_failed"] += len(new_documents)
+            return
+
+        for document_id, document_data in zip(document_ids, new_documents):
+            logger.info(
+                f"Successfully stored {filing_type} for {ticker} "
+                f"(ID: {document_id}, Size: {document_data['document_size_kb']}KB)"
+            )
+        result["filings_processed"] += len(document_ids)
+        result["documents"].extend(document_ids)
+
+    async def _process_filing_limited(self, filing: Dict[str, Any]) -> Dict[str, Any]:
+        """Process a filing once a download slot is free."""
+        async with self._download_semaphore:
+            return await self._process_filing(filing)
+
     async def _process_filing(self, filing: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Process a single filing: download content and save to database.
+        Process a single new filing: download content and build its database record.
+
+        The record is returned rather than saved so the caller can insert a batch at once.
 
         Args:
             filing: Filing metadata from SEC client
 
         Returns:
             Dict with:
-            - status: "processed", "skipped", or "failed"
-            - document_id: UUID if processed
-            - reason: Why skipped/failed
+            - status: "ready" or "failed"
+            - document_data: Record to insert if ready
+            - reason: Why it failed
         """
         accession_number = filing["accession_number"]
         ticker = filing["ticker"]
@@ -216,17 +275,7 @@ class FinancialDocumentIngestionService:
         logger.info(f"Processing {filing_type} for {ticker} - Accession: {accession_number}")
 
         try:
-            # Step 1: Check if already exists
-            existing_doc = self.repository.get_by_accession_number(accession_number)
-            if existing_doc:
-                logger.info(f"Filing already exists: {accession_number} - skipping")
-                return {
-                    "status": "skipped",
-                    "document_id": existing_doc.id,
-                    "reason": "already_exists"
-                }
-
-            # Step 2: Download filing content
+            # Step 1: Download filing content
             logger.info(f"Downloading content for {accession_number}...")
             content = await self.sec_client.download_filing_content(filing["filing_url"])
 
@@ -239,7 +288,7 @@ class FinancialDocumentIngestionService:
                     "content_length": len(content) if content else 0
                 }
 
-            # Step 3: Create document record
+            # Step 2: Create document record
             document_data = {
                 "ticker_symbol": ticker,
                 "company_name": filing["company_name"],
@@ -258,20 +307,9 @@ class FinancialDocumentIngestionService:
                 "chunk_count": 0  # Will be set during indexing
             }
 
-            # Step 4: Save to database
-            document = self.repository.create(document_data)
-
-            logger.info(
-                f"Successfully stored {filing_type} for {ticker} "
-                f"(ID: {document.id}, Size: {document.document_size_kb}KB)"
-            )
-
             return {
-                "status": "processed",
-                "document_id": document.id,
-                "ticker": ticker,
-                "filing_type": filing_type,
-                "size_kb": document.document_size_kb
+                "status": "ready",
+                "document_data": document_data,
             }
 
         except Exception as e:
@@ -325,7 +363,9 @@ class FinancialDocumentIngestionService:
         Ingest documents for multiple companies at once.
 
         WHY: Efficient batch processing
-        HOW: Process companies sequentially (respecting rate limits)
+        HOW: Process companies one at a time, since they share this service's
+             database session; each company's filings still download concurrently
+             and the SEC client keeps requests under its rate limit
 
         Args:
             tickers: List of stock tickers
@@ -359,15 +399,15 @@ class FinancialDocumentIngestionService:
             "results": []
         }
 
+        logger.info(f"Processing {', '.join(tickers)}...")
+        # Each company commits its own short transaction once its downloads finish
+        company_results = []
         for ticker in tickers:
-            logger.info(f"Processing {ticker}...")
-
-            company_result = await self.ingest_company(
-                ticker,
-                filing_types=filing_types,
-                count=count_per_ticker
+            company_results.append(
+                await self.ingest_company(ticker, filing_types=filing_types, count=count_per_ticker)
             )
 
+        for company_result in company_results:
             results["total_documents"] += len(company_result["documents"])
             results["total_processed"] += company_result["filings_processed"]
             results["total_skipped"] += company_result["filings_skipped"]
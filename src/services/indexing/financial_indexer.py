@@ -12,7 +12,7 @@ Flow:
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 from src.services.embeddings.jina_client import JinaEmbeddingsClient
 from src.services.opensearch.financial_client import FinancialOpenSearchClient
@@ -50,12 +50,15 @@ class FinancialDocumentIndexingService:
 
     async def index_document(
         self,
-        document_data: Dict
+        document_data: Dict,
+        refresh: bool = True
     ) -> Dict[str, int]:
         """Index a single financial document with chunking and embeddings.
 
         Args:
             document_data: Document data from FinancialDocument table
+            refresh: Refresh the index after the bulk request; pass False while
+                the caller holds the index in bulk ingest mode
 
         Returns:
             Dictionary with indexing statistics:
@@ -173,7 +176,8 @@ class FinancialDocumentIndexingService:
 
             # Step 4: Index chunks into OpenSearch
             results = self.opensearch_client.bulk_index_chunks(
-                chunks_with_embeddings
+                chunks_with_embeddings,
+                refresh=refresh
             )
 
             logger.info(
@@ -201,16 +205,19 @@ class FinancialDocumentIndexingService:
     async def index_documents_batch(
         self,
         documents: List[Dict],
-        replace_existing: bool = False
-    ) -> Dict[str, int]:
+        replace_existing: bool = False,
+        refresh: bool = True
+    ) -> Dict[str, Any]:
         """Index multiple financial documents in batch.
 
         Args:
             documents: List of document data from database
             replace_existing: If True, delete existing chunks before indexing
+            refresh: Refresh the index after each document's bulk request
 
         Returns:
-            Aggregated statistics
+            Aggregated statistics, plus per_document_chunks mapping the id of
+            each document indexed without errors to its chunk count
         """
         total_stats = {
             "documents_processed": 0,
@@ -218,6 +225,7 @@ class FinancialDocumentIndexingService:
             "total_chunks_indexed": 0,
             "total_embeddings_generated": 0,
             "total_errors": 0,
+            "per_document_chunks": {},
         }
 
         for document in documents:
@@ -228,7 +236,7 @@ class FinancialDocumentIndexingService:
                 self.opensearch_client.delete_document_chunks(document_id)
 
             # Index the document
-            stats = await self.index_document(document)
+            stats = await self.index_document(document, refresh=refresh)
 
             # Update totals
             total_stats["documents_processed"] += 1
@@ -236,6 +244,8 @@ class FinancialDocumentIndexingService:
             total_stats["total_chunks_indexed"] += stats["chunks_indexed"]
             total_stats["total_embeddings_generated"] += stats["embeddings_generated"]
             total_stats["total_errors"] += stats["errors"]
+            if stats["errors"] == 0:
+                total_stats["per_document_chunks"][document.get("id")] = stats["chunks_created"]
 
         logger.info(
             f"Batch indexing complete: "
@@ -1,6 +1,7 @@
 import json
 import logging
 import re
+from itertools import accumulate
 from typing import Dict, List, Optional, Union
 
 from src.schemas.indexing.models import ChunkMetadata, TextChunk
@@ -133,25 +134,31 @@ class TextChunker:
             return []
 
         chunks = []
-        chunk_index = 0
-        current_position = 0
+        num_words = len(words)
+        stride = self.chunk_size - self.overlap_size
 
-        while current_position < len(words):
+        # Character offset of each word boundary in the space-joined text, computed once per document:
+        # word_offsets[k] == len(" ".join(words[:k])) + 1 for k > 0
+        word_offsets = [0, *accumulate(len(word) + 1 for word in words)]
+
+        # Chunk start positions: every stride words, stopping at the first chunk that reaches the end
+        starts = range(0, max(num_words - self.overlap_size, 1), stride)
+
+        for chunk_index, chunk_start in enumerate(starts):
             # Calculate chunk boundaries
-            chunk_start = current_position
-            chunk_end = min(current_position + self.chunk_size, len(words))
+            chunk_end = min(chunk_start + self.chunk_size, num_words)
 
             # Extract chunk words
             chunk_words = words[chunk_start:chunk_end]
             chunk_text = self._reconstruct_text(chunk_words)
 
             # Calculate character offsets (approximate)
-            start_char = len(" ".join(words[:chunk_start])) if chunk_start > 0 else 0
-            end_char = len(" ".join(words[:chunk_end]))
+            start_char = word_offsets[chunk_start] - 1 if chunk_start > 0 else 0
+            end_char = word_offsets[chunk_end] - 1
 
             # Calculate overlaps
             overlap_with_previous = min(self.overlap_size, chunk_start) if chunk_start > 0 else 0
-            overlap_with_next = self.overlap_size if chunk_end < len(words) else 0
+            overlap_with_next = self.overlap_size if chunk_end < num_words else 0
 
             # Create chunk
             chunk = TextChunk(
@@ -170,14 +177,6 @@ class TextChunker:
             )
             chunks.append(chunk)
 
-            # Move to next chunk position (with overlap)
-            current_position += self.chunk_size - self.overlap_size
-            chunk_index += 1
-
-            # Break if we've processed all words
-            if chunk_end >= len(words):
-                break
-
         logger.info(f"Chunked paper {arxiv_id}: {len(words)} words -> {len(chunks)} chunks")
 
         return chunks
@@ -344,7 +344,7 @@ class MetadataFetcher:
             Number of papers stored successfully
         """
         paper_repo = PaperRepository(db_session)
-        stored_count = 0
+        paper_creates = []
 
         for paper in papers:
             try:
@@ -379,16 +379,18 @@ class MetadataFetcher:
                     )
                     logger.debug(f"Storing paper {paper.arxiv_id} with metadata only")
 
-                paper_create = PaperCreate(**paper_data)
-                stored_paper = paper_repo.upsert(paper_create)
-
-                if stored_paper:
-                    stored_count += 1
-                    content_info = "with parsed content" if parsed_paper else "metadata only"
-                    logger.debug(f"Stored paper {paper.arxiv_id} to database ({content_info})")
+                paper_creates.append(PaperCreate(**paper_data))
 
             except Exception as e:
-                logger.error(f"Failed to store paper {paper.arxiv_id}: {e}")
+                logger.error(f"Failed to prepare paper {paper.arxiv_id}: {e}")
+
+        # Write all papers in one transaction with batched upserts instead of a round trip per paper
+        try:
+            stored_count = paper_repo.bulk_upsert(paper_creates)
+        except Exception as e:
+            logger.error(f"Failed to store papers to database: {e}")
+            db_session.rollback()
+            return 0
 
         # Commit all changes
         try:
@@ -1,5 +1,6 @@
 from .client import OpenSearchClient
 from .factory import make_opensearch_client, make_opensearch_client_fresh
+from .ingest_mode import bulk_ingest_mode
 from .query_builder import QueryBuilder
 
-__all__ = ["OpenSearchClient", "make_opensearch_client", "make_opensearch_client_fresh", "QueryBuilder"]
+__all__ = ["OpenSearchClient", "make_opensearch_client", "make_opensearch_client_fresh", "QueryBuilder", "bulk_ingest_mode"]
@@ -11,6 +11,11 @@ from .query_builder import QueryBuilder
 
 logger = logging.getLogger(__name__)
 
+# Bulk requests are capped by document count and payload size, whichever is hit first
+BULK_CHUNK_SIZE = 500
+BULK_MAX_CHUNK_BYTES = 10 * 1024 * 1024
+BULK_REQUEST_TIMEOUT = 120
+
 
 class OpenSearchClient:
     """OpenSearch client supporting BM25 and hybrid search with native RRF."""
@@ -316,10 +321,14 @@ class OpenSearchClient:
             logger.error(f"Error indexing chunk: {e}")
             return False
 
-    def bulk_index_chunks(self, chunks: List[Dict[str, Any]]) -> Dict[str, int]:
+    def bulk_index_chunks(self, chunks: List[Dict[str, Any]], refresh: bool = True) -> Dict[str, int]:
         """Bulk index multiple chunks with embeddings.
 
-        :param chunks: List of dicts with 'chunk_data' and 'embedding'
+        Requests are split at BULK_CHUNK_SIZE documents or BULK_MAX_CHUNK_BYTES, whichever comes first.
+
+        :param chunks: List of dicts with 'chunk_data' and 'embedding', and optionally 'id'; chunks with an
+            id overwrite the document with that id, the rest get an auto-generated id
+        :param refresh: Refresh after each request; pass False when the caller refreshes once at the end
         :returns: Statistics
         """
         from opensearchpy import helpers
@@ -330,10 +339,19 @@ class OpenSearchClient:
                 chunk_data = chunk["chunk_data"].copy()
                 chunk_data["embedding"] = chunk["embedding"]
 
-                action = {"_index": self.index_name, "_source": chunk_data}
+                action = {"_op_type": "index", "_index": self.index_name, "_source": chunk_data}
+                if chunk.get("id"):
+                    action["_id"] = chunk["id"]
                 actions.append(action)
 
-            success, failed = helpers.bulk(self.client, actions, refresh=True)
+            success, failed = helpers.bulk(
+                self.client,
+                actions,
+                chunk_size=BULK_CHUNK_SIZE,
+                max_chunk_bytes=BULK_MAX_CHUNK_BYTES,
+                request_timeout=BULK_REQUEST_TIMEOUT,
+                refresh=refresh,
+            )
 
             logger.info(f"Bulk indexed {success} chunks, {len(failed)} failed")
             return {"success": success, "failed": len(failed)}
@@ -174,10 +174,11 @@ class FinancialOpenSearchClient:
             logger.error(f"Error indexing chunk: {e}")
             return False
 
-    def bulk_index_chunks(self, chunks: List[Dict[str, Any]]) -> Dict[str, int]:
+    def bulk_index_chunks(self, chunks: List[Dict[str, Any]], refresh: bool = True) -> Dict[str, int]:
         """Bulk index multiple chunks with embeddings.
 
         :param chunks: List of dicts with 'chunk_data' and 'embedding'
+        :param refresh: Refresh after the request; pass False when the caller refreshes once at the end
         :returns: Statistics
         """
         from opensearchpy import helpers
@@ -194,7 +195,7 @@ class FinancialOpenSearchClient:
                 }
                 actions.append(action)
 
-            success, failed = helpers.bulk(self.client, actions, refresh=True)
+            success, failed = helpers.bulk(self.client, actions, refresh=refresh)
 
             logger.info(f"Bulk indexed {success} financial chunks, {len(failed)} failed")
             return {"success": success, "failed": len(failed)}
@@ -0,0 +1,49 @@
+"""Temporary index settings for bulk loads."""
+
+import logging
+from contextlib import contextmanager
+from typing import Iterator
+
+from opensearchpy import OpenSearch
+
+logger = logging.getLogger(__name__)
+
+# Settings applied while a bulk load runs: no periodic refreshes and no replica writes
+BULK_INGEST_SETTINGS = {"refresh_interval": "-1", "number_of_replicas": 0}
+
+# Restored when the index does not report a value (OpenSearch defaults)
+DEFAULT_INDEX_SETTINGS = {"refresh_interval": "1s", "number_of_replicas": 1}
+
+
+@contextmanager
+def bulk_ingest_mode(client: OpenSearch, index_name: str, force_merge: bool = False) -> Iterator[None]:
+    """Disable refreshes and replicas on an index for the duration of a bulk load.
+
+    The index's previous settings are restored on exit, followed by one explicit refresh
+    and, optionally, a force merge down to a single segment. The merge is skipped when the
+    load raised, so a failed run never rewrites the live index's segments.
+
+    :param client: Raw OpenSearch client
+    :param index_name: Index being loaded
+    :param force_merge: Merge segments once the load finishes successfully; only worth it
+        after a full rebuild, not an incremental load
+    """
+    current = client.indices.get_settings(index=index_name, flat_settings=True, include_defaults=True).get(index_name, {})
+    restore = {}
+    for key, default in DEFAULT_INDEX_SETTINGS.items():
+        setting = f"index.{key}"
+        restore[key] = current.get("settings", {}).get(setting, current.get("defaults", {}).get(setting, default))
+
+    logger.info(f"Bulk ingest mode on for {index_name} (restoring {restore} afterwards)")
+    client.indices.put_settings(index=index_name, body={"index": BULK_INGEST_SETTINGS})
+
+    loaded = False
+    try:
+        yield
+        loaded = True
+    finally:
+        client.indices.put_settings(index=index_name, body={"index": restore})
+        client.indices.refresh(index=index_name)
+        if force_merge and loaded:
+            client.indices.forcemerge(index=index_name, max_num_segments=1)
+        logger.info(f"Bulk ingest mode off for {index_name}")
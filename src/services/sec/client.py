@@ -13,14 +13,24 @@ SEC EDGAR Documentation: https://www.sec.gov/edgar/sec-api-documentation
 """
 
 import asyncio
+import json
 import logging
+import os
+import time
 from datetime import datetime
+from pathlib import Path
 from typing import List, Optional, Dict, Any
 import httpx
 from bs4 import BeautifulSoup
 
 logger = logging.getLogger(__name__)
 
+# SEC's ticker -> CIK file is a few MB and changes rarely, so it is kept on disk and refreshed daily
+TICKER_CACHE_PATH = Path(
+    os.getenv("SEC_TICKER_CACHE_PATH", Path.home() / ".cache" / "arxiv-curator" / "sec_tickers.json")
+)
+TICKER_CACHE_MAX_AGE_SECONDS = 24 * 60 * 60
+
 
 class SECEdgarClient:
     """
@@ -60,7 +70,11 @@ class SECEdgarClient:
         # Calculate delay between requests to stay under rate limit
         # Example: 10 req/sec = 0.1 seconds between requests
         self._request_delay = 1.0 / rate_limit_per_second
-        self._last_request_time = 0.0
+        self._next_request_time = 0.0
+
+        # Ticker -> company info, loaded once per client from the disk cache or SEC
+        self._companies_by_ticker: Optional[Dict[str, Dict[str, str]]] = None
+        self._companies_lock = asyncio.Lock()
 
         # HTTP client with proper headers
         self.client = httpx.AsyncClient(
@@ -79,17 +93,18 @@ class SECEdgarClient:
         Enforce rate limiting.
 
         WHY: SEC requires max 10 requests/second
-        HOW: Wait if needed before making next request
+        HOW: Reserve the next free request slot, then wait for it
+
+        Reserving happens before any await, so concurrent callers each get their
+        own slot instead of all seeing the same last request time.
         """
-        current_time = asyncio.get_event_loop().time()
-        time_since_last_request = current_time - self._last_request_time
+        current_time = asyncio.get_running_loop().time()
+        request_time = max(current_time, self._next_request_time)
+        self._next_request_time = request_time + self._request_delay
 
-        if time_since_last_request < self._request_delay:
+        if request_time > current_time:
             # Need to wait before next request
-            wait_time = self._request_delay - time_since_last_request
-            await asyncio.sleep(wait_time)
-
-        self._last_request_time = asyncio.get_event_loop().time()
+            await asyncio.sleep(request_time - current_time)
 
     async def lookup_company(self, ticker: str) -> Optional[Dict[str, str]]:
         """
@@ -112,43 +127,85 @@ class SECEdgarClient:
             #   "company_name": "Apple Inc."
             # }
         """
-        await self._rate_limit()
-
         ticker = ticker.upper().strip()
         logger.info(f"Looking up company: {ticker}")
 
         try:
-            # SEC provides a company tickers JSON file
-            # This is the easiest way to map ticker → CIK
-            url = f"{self.BASE_URL}/files/company_tickers.json"
-            response = await self.client.get(url)
-            response.raise_for_status()
+            companies = await self._get_companies_by_ticker()
+        except Exception as e:
+            logger.error(f"Error looking up company {ticker}: {e}")
+            return None
 
-            # Parse the JSON
-            companies = response.json()
+        result = companies.get(ticker)
+        if result is None:
+            logger.warning(f"Company not found: {ticker}")
+            return None
 
-            # Search for our ticker
-            for key, company_data in companies.items():
-                if company_data.get("ticker") == ticker:
-                    # Found it!
-                    cik = str(company_data["cik_str"]).zfill(10)  # Pad to 10 digits
+        logger.info(f"Found company: {result['company_name']} (CIK: {result['cik']})")
+        return dict(result)
 
-                    result = {
-                        "ticker": ticker,
-                        "cik": cik,
-                        "company_name": company_data["title"]
-                    }
+    async def _get_companies_by_ticker(self) -> Dict[str, Dict[str, str]]:
+        """
+        Return the ticker -> company info mapping, loading it on first use.
 
-                    logger.info(f"Found company: {result['company_name']} (CIK: {cik})")
-                    return result
+        WHY: Every lookup used to download company_tickers.json again
+        HOW: Read the disk cache if it is fresh, otherwise download once and save it
+        """
+        async with self._companies_lock:
+            if self._companies_by_ticker is None:
+                companies = self._read_ticker_cache()
+                if companies is None:
+                    companies = await self._download_company_tickers()
+                    self._write_ticker_cache(companies)
+                self._companies_by_ticker = self._index_companies(companies)
+            return self._companies_by_ticker
+
+    async def _download_company_tickers(self) -> Dict[str, Any]:
+        """Download SEC's company tickers JSON file (the easiest way to map ticker → CIK)."""
+        await self._rate_limit()
 
-            logger.warning(f"Company not found: {ticker}")
-            return None
+        url = f"{self.BASE_URL}/files/company_tickers.json"
+        response = await self.client.get(url)
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _index_companies(companies: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+        """Turn SEC's {"0": {"cik_str", "ticker", "title"}, ...} file into a dict keyed by ticker."""
+        by_ticker = {}
+        for company_data in companies.values():
+            ticker = company_data.get("ticker")
+            # The file can list a ticker more than once; keep the first entry like a linear search would
+            if ticker and ticker not in by_ticker:
+                by_ticker[ticker] = {
+                    "ticker": ticker,
+                    "cik": str(company_data["cik_str"]).zfill(10),  # Pad to 10 digits
+                    "company_name": company_data["title"],
+                }
+        return by_ticker
 
-        except Exception as e:
-            logger.error(f"Error looking up company {ticker}: {e}")
+    @staticmethod
+    def _read_ticker_cache() -> Optional[Dict[str, Any]]:
+        """Return the cached company tickers file, or None if it is missing, stale or unreadable."""
+        try:
+            if time.time() - TICKER_CACHE_PATH.stat().st_mtime > TICKER_CACHE_MAX_AGE_SECONDS:
+                return None
+            return json.loads(TICKER_CACHE_PATH.read_bytes())
+        except (OSError, ValueError):
             return None
 
+    @staticmethod
+    def _write_ticker_cache(companies: Dict[str, Any]) -> None:
+        """Save the company tickers file; a read-only filesystem only costs a re-download next time."""
+        try:
+            TICKER_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so a concurrent reader never sees a partial file
+            tmp_path = TICKER_CACHE_PATH.with_suffix(".json.tmp")
+            tmp_path.write_text(json.dumps(companies))
+            os.replace(tmp_path, TICKER_CACHE_PATH)
+        except OSError as e:
+            logger.warning(f"Could not cache SEC company tickers at {TICKER_CACHE_PATH}: {e}")
+
     async def fetch_10k_filings(
         self,
         ticker: str,
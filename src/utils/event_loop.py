@@ -0,0 +1,19 @@
+"""Event loop selection for the command-line scripts."""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+# uvloop (installed with uvicorn[standard], not available on Windows) runs the event loop in C
+try:
+    import uvloop
+
+    EVENT_LOOP_FACTORY = uvloop.new_event_loop
+except ImportError:
+    EVENT_LOOP_FACTORY = None
+
+
+def run_with_uvloop(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine like asyncio.run, on uvloop when it is installed."""
+    return asyncio.run(main, loop_factory=EVENT_LOOP_FACTORY)
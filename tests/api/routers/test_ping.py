@@ -1,4 +1,15 @@
+from unittest.mock import AsyncMock, patch
+
 import pytest
+from src.routers import ping
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Keep cached health/stats responses from leaking between tests."""
+    ping._response_cache.clear()
+    yield
+    ping._response_cache.clear()
 
 
 async def test_health_check(client):
@@ -9,3 +20,16 @@ async def test_health_check(client):
     assert "service_name" in data
     assert "version" in data
     assert "services" in data
+
+
+async def test_health_check_reuses_recent_result(client):
+    with patch("src.routers.ping.OllamaClient") as mock_ollama:
+        mock_ollama.return_value.health_check = AsyncMock(return_value={"status": "healthy", "message": "ok"})
+
+        await client.get("/api/v1/health")
+        await client.get("/api/v1/health")
+        assert mock_ollama.call_count == 1
+
+        response = await client.get("/api/v1/health", params={"fresh": "true"})
+        assert response.status_code == 200
+        assert mock_ollama.call_count == 2
@@ -0,0 +1,53 @@
+from unittest.mock import MagicMock
+
+import pytest
+from src.services.opensearch.ingest_mode import bulk_ingest_mode
+
+
+def make_client(settings=None, defaults=None):
+    client = MagicMock()
+    client.indices.get_settings.return_value = {
+        "chunks": {"settings": settings or {}, "defaults": defaults or {}},
+    }
+    return client
+
+
+def test_bulk_ingest_mode_restores_previous_settings():
+    client = make_client(settings={"index.refresh_interval": "5s", "index.number_of_replicas": "0"})
+
+    with bulk_ingest_mode(client, "chunks", force_merge=True):
+        client.indices.put_settings.assert_called_once_with(
+            index="chunks", body={"index": {"refresh_interval": "-1", "number_of_replicas": 0}}
+        )
+
+    client.indices.put_settings.assert_called_with(
+        index="chunks", body={"index": {"refresh_interval": "5s", "number_of_replicas": "0"}}
+    )
+    client.indices.refresh.assert_called_once_with(index="chunks")
+    client.indices.forcemerge.assert_called_once_with(index="chunks", max_num_segments=1)
+
+
+def test_bulk_ingest_mode_falls_back_to_defaults():
+    client = make_client(defaults={"index.refresh_interval": "1s"})
+
+    with bulk_ingest_mode(client, "chunks"):
+        pass
+
+    client.indices.put_settings.assert_called_with(
+        index="chunks", body={"index": {"refresh_interval": "1s", "number_of_replicas": 1}}
+    )
+    client.indices.forcemerge.assert_not_called()
+
+
+def test_bulk_ingest_mode_restores_settings_on_error():
+    client = make_client(settings={"index.refresh_interval": "1s", "index.number_of_replicas": "1"})
+
+    with pytest.raises(RuntimeError):
+        with bulk_ingest_mode(client, "chunks", force_merge=True):
+            raise RuntimeError("bulk load failed")
+
+    client.indices.put_settings.assert_called_with(
+        index="chunks", body={"index": {"refresh_interval": "1s", "number_of_replicas": "1"}}
+    )
+    client.indices.refresh.assert_called_once_with(index="chunks")
+    client.indices.forcemerge.assert_not_called()